@@ -18,9 +18,11 @@ from __future__ import annotations
 import json
 import re
 import uuid
+from bisect import insort
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 # -----------------------------------------------------------------------------
@@ -102,6 +104,34 @@ def civil_from_days(z: int) -> Tuple[int, int, int]:
 # month lengths in Gregorian
 _GREGORIAN_MONTH_LENGTHS = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
 
+# no-leap lookup tables: 0-based day-of-year -> month / day-of-month
+_DOY_TO_MONTH = bytes(
+    m + 1 for m, ml in enumerate(_GREGORIAN_MONTH_LENGTHS) for _ in range(ml)
+)
+_DOY_TO_MDAY = bytes(d + 1 for ml in _GREGORIAN_MONTH_LENGTHS for d in range(ml))
+
+# days before each month in the 365-day calendar
+_NO_LEAP_CUMULATIVE = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+
+def days_from_civil_no_leap(y: int, m: int, d: int) -> int:
+    """
+    Convert (y,m,d) to a 0-based ordinal in the 365-day calendar, with
+    0001-01-01 at 0. There is no year 0, so -1-12-31 maps to -1.
+    """
+    # 修复：正确处理负数年份的 ordinal 计算（没有公元 0 年，y > 0 时减 1）
+    return (y - (y > 0)) * 365 + _NO_LEAP_CUMULATIVE[m - 1] + d - 1
+
+
+def civil_from_days_no_leap(z: int) -> Tuple[int, int, int]:
+    """
+    Convert a 365-day calendar ordinal to (year, month, day).
+    Inverse of days_from_civil_no_leap.
+    """
+    # 修复：正确处理负数 ordinal 对应的年份和年内天数（没有公元 0 年）
+    q, r = divmod(int(z), 365)
+    return (q + 1 if q >= 0 else q), _DOY_TO_MONTH[r], _DOY_TO_MDAY[r]
+
 
 def is_gregorian_leap(year: int) -> bool:
     """Return True if year is leap in proleptic Gregorian calendar."""
@@ -118,12 +148,16 @@ def is_gregorian_leap(year: int) -> bool:
     return False
 
 
+def days_in_month(year: int, month: int) -> int:
+    """Return the length of month in year (proleptic Gregorian, BCE aware)."""
+    if month == 2 and is_gregorian_leap(year):
+        return 29
+    return _GREGORIAN_MONTH_LENGTHS[month - 1]
+
+
 def day_of_year_no_leap(year: int, month: int, day: int) -> int:
     """Compute day-of-year (1-based) treating Feb as 28 always."""
-    cum = [0]
-    for ml in _GREGORIAN_MONTH_LENGTHS:
-        cum.append(cum[-1] + ml)
-    return cum[month - 1] + day
+    return _NO_LEAP_CUMULATIVE[month - 1] + day
 
 
 def day_of_year_real(year: int, month: int, day: int) -> int:
@@ -138,7 +172,7 @@ def day_of_year_real(year: int, month: int, day: int) -> int:
     return cum[month - 1] + day
 
 
-@dataclass(order=True, frozen=True)
+@dataclass(eq=False, frozen=True, slots=True)
 class GameDate:
     """
     Lightweight date class supporting arbitrary integer years.
@@ -146,24 +180,70 @@ class GameDate:
     - year: int (can be negative for BCE)
     - month: 1..12
     - day: 1..31 (validation minimal here)
+
+    Both ordinals are computed once at construction. Equality, ordering and
+    hashing use order_key(), the real-calendar ordinal made one-to-one.
     """
 
     year: int
     month: int
     day: int
+    _ord: int = field(init=False, repr=False)
+    _ord_no_leap: int = field(init=False, repr=False)
+    _key: int = field(init=False, repr=False)
 
     def __post_init__(self):
         # 增强验证
         if not (1 <= self.month <= 12):
             raise ValueError(f"month must be 1..12, got {self.month}")
 
-        max_day = _GREGORIAN_MONTH_LENGTHS[self.month - 1]
-        if self.month == 2 and is_gregorian_leap(self.year):
-            max_day = 29
+        max_day = days_in_month(self.year, self.month)
         if not (1 <= self.day <= max_day):
             raise ValueError(
                 f"day must be 1..{max_day} for {self.year}-{self.month}, got {self.day}"
             )
+        object.__setattr__(
+            self, "_ord", days_from_civil(self.year, self.month, self.day)
+        )
+        object.__setattr__(
+            self,
+            "_ord_no_leap",
+            days_from_civil_no_leap(self.year, self.month, self.day),
+        )
+        # years 0 and -1 are both astronomical year 0 and share real ordinals;
+        # the low bit keeps them apart and sorts -1 first
+        object.__setattr__(self, "_key", self._ord * 2 + (self.year == 0))
+
+    # -------------------------
+    # Comparisons
+    # -------------------------
+    def __eq__(self, other):
+        if other.__class__ is not GameDate:
+            return NotImplemented
+        return self._key == other._key
+
+    def __lt__(self, other):
+        if other.__class__ is not GameDate:
+            return NotImplemented
+        return self._key < other._key
+
+    def __le__(self, other):
+        if other.__class__ is not GameDate:
+            return NotImplemented
+        return self._key <= other._key
+
+    def __gt__(self, other):
+        if other.__class__ is not GameDate:
+            return NotImplemented
+        return self._key > other._key
+
+    def __ge__(self, other):
+        if other.__class__ is not GameDate:
+            return NotImplemented
+        return self._key >= other._key
+
+    def __hash__(self):
+        return hash(self._key)
 
     # -------------------------
     # Factories & parsing
@@ -187,27 +267,7 @@ class GameDate:
             return s
         if isinstance(s, int):
             return cls(year=s, month=1, day=1)
-        text = str(s).strip()
-        if not text:
-            raise ValueError("empty date string")
-        # direct ISO-like
-        m = DATE_PARSE_REGEX.match(text)
-        if not m:
-            # Try simple YYYYMMDD
-            digits = re.fullmatch(r"([+-]?\d{1,5})(\d{2})(\d{2})$", text)
-            if digits:
-                y = int(digits.group(1))
-                mo = int(digits.group(2))
-                da = int(digits.group(3))
-                return cls(year=y, month=mo, day=da)
-            raise ValueError(f"Unrecognized date string: {text}")
-        year_s = m.group(1)
-        mo_s = m.group(2)
-        da_s = m.group(3)
-        y = int(year_s)
-        mo = int(mo_s) if mo_s else 1
-        da = int(da_s) if da_s else 1
-        return cls(year=y, month=mo, day=da)
+        return _parse_date_text(str(s))
 
     def to_iso(self) -> str:
         """Return ISO-like YYYY-MM-DD, with sign for negative years if needed."""
@@ -226,39 +286,19 @@ class GameDate:
     # Ordinal conversions
     # -------------------------
     def to_ordinal(self, ignore_leap: bool = False) -> int:
-        if not ignore_leap:
-            return days_from_civil(self.year, self.month, self.day)
-        # 修复：正确处理负数年份的 ordinal 计算
-        doy = day_of_year_no_leap(self.year, self.month, self.day)
-        y = self.year
-        if y > 0:
-            return (y - 1) * 365 + (doy - 1)
-        else:
-            return y * 365 + (doy - 1)
+        return self._ord_no_leap if ignore_leap else self._ord
+
+    def order_key(self) -> int:
+        """Integer that orders dates and is equal only for equal dates."""
+        return self._key
 
     @classmethod
     def from_ordinal(cls, ordinal: int, ignore_leap: bool = False) -> "GameDate":
         if not ignore_leap:
             y, m, d = civil_from_days(int(ordinal))
-            return cls(year=y, month=m, day=d)
-        # 修复：正确处理负数 ordinal 对应的年份和年内天数
-        if ordinal >= 0:
-            year = ordinal // 365 + 1
-            doy = ordinal % 365 + 1
         else:
-            year = -((-ordinal - 1) // 365 + 1)
-            doy = 365 - ((-ordinal - 1) % 365)
-        # 从 doy 反推 month 和 day
-        cum = [0]
-        for ml in _GREGORIAN_MONTH_LENGTHS:
-            cum.append(cum[-1] + ml)
-        month = 1
-        for i in range(1, 13):
-            if doy <= cum[i]:
-                month = i
-                break
-        day = doy - cum[month - 1]
-        return cls(year=year, month=month, day=day)
+            y, m, d = civil_from_days_no_leap(ordinal)
+        return cls(year=y, month=m, day=d)
 
     # -------------------------
     # Arithmetic
@@ -292,6 +332,55 @@ class GameDate:
             return self.add_days(-int(other))  # type: ignore[return-value]
 
 
+@lru_cache(maxsize=4096)
+def _parse_date_text(s: str) -> GameDate:
+    """
+    String half of GameDate.fromiso. GameDate is immutable, so repeated
+    strings (metadata.json is full of them) share one parsed instance.
+    """
+    text = s.strip()
+    if not text:
+        raise ValueError("empty date string")
+    # fast path: canonical to_iso() output, [-]YYYY-MM-DD
+    o = 1 if text[0] == "-" else 0
+    if (
+        len(text) == 10 + o
+        and text[4 + o] == "-"
+        and text[7 + o] == "-"
+        and text.isascii()
+        and text[o : 4 + o].isdigit()
+        and text[5 + o : 7 + o].isdigit()
+        and text[8 + o :].isdigit()
+    ):
+        return GameDate(
+            year=int(text[: 4 + o]),
+            month=int(text[5 + o : 7 + o]),
+            day=int(text[8 + o :]),
+        )
+    # direct ISO-like
+    m = DATE_PARSE_REGEX.match(text)
+    if not m:
+        # Try simple YYYYMMDD
+        digits = re.fullmatch(r"([+-]?\d{1,5})(\d{2})(\d{2})$", text)
+        if digits:
+            y = int(digits.group(1))
+            mo = int(digits.group(2))
+            da = int(digits.group(3))
+            return GameDate(year=y, month=mo, day=da)
+        raise ValueError(f"Unrecognized date string: {text}")
+    year_s = m.group(1)
+    mo_s = m.group(2)
+    da_s = m.group(3)
+    y = int(year_s)
+    mo = int(mo_s) if mo_s else 1
+    da = int(da_s) if da_s else 1
+    return GameDate(year=y, month=mo, day=da)
+
+
+def _snapshot_ordinal(s: "Snapshot") -> int:
+    return s.date.order_key()
+
+
 # -----------------------------------------------------------------------------
 # Enums, dataclasses (unchanged interface but use GameDate)
 # -----------------------------------------------------------------------------
@@ -304,6 +393,21 @@ class FilterType(str, Enum):
     CUSTOM = "custom"
 
 
+def filter_key_of(filter_type: Any) -> str:
+    """Return the plain string key for a FilterType or filter name."""
+    return getattr(filter_type, "value", None) or str(filter_type)
+
+
+def as_filter_type(filter_type: Any) -> Any:
+    """Map a filter name to its FilterType member; unknown names pass through."""
+    if isinstance(filter_type, FilterType):
+        return filter_type
+    try:
+        return FilterType(filter_type)
+    except ValueError:
+        return filter_type
+
+
 class Rank(str, Enum):
     HEGEMONY = "hegemony"
     EMPIRE = "empire"
@@ -347,6 +451,14 @@ class Snapshot:
     ocr_extracted: Optional[str] = None
     extra: Dict[str, Any] = field(default_factory=dict)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "filter_type":
+            # plain names become enum members so filters can be matched with `is`
+            value = as_filter_type(value)
+            # normalized string form of filter_type, kept in sync for fast matching
+            object.__setattr__(self, "filter_key", filter_key_of(value))
+        object.__setattr__(self, name, value)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
@@ -536,6 +648,12 @@ class Campaign:
     created_at: Optional[str] = None
     modified_at: Optional[str] = None
     meta: Dict[str, Any] = field(default_factory=dict)
+    # id -> Snapshot, rebuilt lazily whenever the snapshots list is replaced or resized
+    _id_index: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # bumped by the snapshot mutators below and by mark_snapshots_changed()
+    _version: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """对象初始化后自动设置时间戳"""
@@ -548,12 +666,57 @@ class Campaign:
         # modified_at 总是更新为当前时间
         self.modified_at = now
 
+    def mark_snapshots_changed(self) -> None:
+        """
+        Call after editing snapshots in place, e.g. snaps[i] = other or
+        re-dating / re-filtering a snapshot.
+        """
+        self._version += 1
+
+    def snapshots_state(self) -> tuple:
+        """
+        Changes whenever the snapshots list is replaced, resized or marked
+        changed; indexes compare it to decide when to rebuild.
+        """
+        snaps = self.snapshots
+        return (id(snaps), len(snaps), self._version)
+
+    def _snapshots_by_id(self) -> Dict[str, Snapshot]:
+        snaps = self.snapshots
+        key = (id(snaps), len(snaps), self._version)
+        cached = self._id_index
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        # reversed so the first snapshot wins on duplicate ids, like a scan would
+        index = {s.id: s for s in reversed(snaps)}
+        self._id_index = (key, index)
+        return index
+
+    def get_snapshot_by_id(self, snapshot_id: str) -> Optional[Snapshot]:
+        return self._snapshots_by_id().get(snapshot_id)
+
     def add_snapshot(self, snapshot: Snapshot) -> None:
-        if any(s.id == snapshot.id for s in self.snapshots):
+        index = self._snapshots_by_id()
+        if snapshot.id in index:
             raise ValueError(f"Snapshot with id {snapshot.id} already exists")
-        self.snapshots.append(snapshot)
-        # sort by ordinal (use real calendar by default; engine may use no-leap override)
-        self.snapshots.sort(key=lambda s: s.date.to_ordinal(ignore_leap=False))
+        # keep sorted by ordinal (real calendar; engine may use no-leap override);
+        # insort after equal dates, matching what append + stable sort did
+        insort(self.snapshots, snapshot, key=_snapshot_ordinal)
+        self._version += 1
+        index[snapshot.id] = snapshot
+        self._id_index = (
+            (id(self.snapshots), len(self.snapshots), self._version),
+            index,
+        )
+
+    def remove_snapshot(self, snapshot_id: str) -> Optional[Snapshot]:
+        """Remove and return the snapshot with snapshot_id, or None if absent."""
+        snap = self.get_snapshot_by_id(snapshot_id)
+        if snap is None:
+            return None
+        self.snapshots.remove(snap)
+        self._version += 1
+        return snap
 
     def find_snapshot(
         self, date_obj: Union[str, GameDate], filter_type: Optional[FilterType] = None
@@ -574,16 +737,19 @@ class Campaign:
         target = (
             date_obj if isinstance(date_obj, GameDate) else GameDate.fromiso(date_obj)
         )
-        candidates = [
-            s
-            for s in self.snapshots
-            if s.date.to_ordinal(ignore_leap=False)
-            <= target.to_ordinal(ignore_leap=False)
-            and (filter_type is None or s.filter_type == filter_type)
-        ]
-        if not candidates:
-            return None
-        return max(candidates, key=lambda s: s.date.to_ordinal(ignore_leap=False))
+        target_ord = target.to_ordinal(ignore_leap=False)
+        key = None if filter_type is None else filter_key_of(filter_type)
+        # single pass; ties keep the first snapshot, as max() did
+        best = None
+        best_ord = None
+        for s in self.snapshots:
+            if key is not None and s.filter_key != key:
+                continue
+            o = s.date.to_ordinal(ignore_leap=False)
+            if o <= target_ord and (best_ord is None or o > best_ord):
+                best = s
+                best_ord = o
+        return best
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -616,7 +782,7 @@ class Campaign:
             modified_at=data.get("modified_at"),
             meta=data.get("meta", {}),
         )
-        camp.snapshots.sort(key=lambda s: s.date.to_ordinal(ignore_leap=False))
+        camp.snapshots.sort(key=_snapshot_ordinal)
         return camp
 
     @classmethod
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from bisect import bisect_right
 from typing import List, Optional
 
 from PySide6.QtCore import Qt, QUrl
@@ -22,15 +23,22 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from chroniclemap.core.models import FilterType, GameDate
+from chroniclemap.core.models import FilterType, GameDate, days_in_month
 from chroniclemap.gui.campaign_store import CampaignStore
 from chroniclemap.gui.import_widget import ImportWidget
-from chroniclemap.gui.player_window import PlayerWindow
 from chroniclemap.gui.texts import tr
 from chroniclemap.storage.manager import StorageManager
 from chroniclemap.vision.ocr import TesseractOCRProvider
 
 
+def _date_ordinal(value: Optional[str]) -> float:
+    # rows with unparsable dates sort first, matching metadata order
+    try:
+        return GameDate.fromiso(value).to_ordinal()
+    except Exception:
+        return float("-inf")
+
+
 class CampaignDetailWindow(QWidget):
     def __init__(
         self,
@@ -142,7 +150,7 @@ class CampaignDetailWindow(QWidget):
         bottom.addWidget(self.close_btn)
         layout.addLayout(bottom)
 
-        self.refresh_btn.clicked.connect(self.refresh_snapshots)
+        self.refresh_btn.clicked.connect(self._reload_snapshots)
         self.open_player_btn.clicked.connect(self._open_player)
         self.close_btn.clicked.connect(self.close)
         self.snapshot_list.itemSelectionChanged.connect(self._on_selection_changed)
@@ -153,13 +161,14 @@ class CampaignDetailWindow(QWidget):
         self.bulk_date_btn.clicked.connect(self._apply_bulk_date_offset)
         self.bulk_delete_btn.clicked.connect(self._delete_selected_snapshots)
 
+        # both widgets live on the GUI thread; skip the per-emit thread check
         if hasattr(self.import_widget, "snapshot_added"):
             self.import_widget.snapshot_added.connect(
-                lambda _snap: self.refresh_snapshots()
+                self._on_snapshot_added, Qt.DirectConnection
             )
         if hasattr(self.import_widget, "filter_changed"):
             self.import_widget.filter_changed.connect(
-                lambda _name: self.refresh_snapshots()
+                lambda _name: self.refresh_snapshots(), Qt.DirectConnection
             )
 
         self.refresh_snapshots()
@@ -195,7 +204,23 @@ class CampaignDetailWindow(QWidget):
             self.import_widget.retranslate_ui()
 
     def refresh_snapshots(self) -> None:
+        self.snapshot_list.setUpdatesEnabled(False)
+        try:
+            self._fill_snapshot_list()
+        finally:
+            self.snapshot_list.setUpdatesEnabled(True)
+
+    def closeEvent(self, event) -> None:
+        # stop a running batch import before it asks for more OCR, then
+        # release the OCR worker threads (and their Tesseract instances)
+        self.import_widget.cancel_batch()
+        self.ocr.close()
+        super().closeEvent(event)
+
+    def _fill_snapshot_list(self) -> None:
+        # rows and their ordinals must stay in lockstep for bisect inserts
         self.snapshot_list.clear()
+        self._row_ords = []
         try:
             meta = self.store.load_metadata(self.campaign_name) or {}
         except FileNotFoundError:
@@ -210,15 +235,39 @@ class CampaignDetailWindow(QWidget):
             current_filter = None
 
         for s in snaps:
-            date = s.get("date") or ""
             filter_type = s.get("filter_type") or s.get("filter") or ""
             if current_filter and filter_type and filter_type != current_filter:
                 continue
-            path = s.get("path") or ""
-            text = f"{date} [{filter_type}] | {os.path.basename(path)}"
-            item = QListWidgetItem(text)
-            item.setData(Qt.UserRole, s)
-            self.snapshot_list.addItem(item)
+            self.snapshot_list.addItem(self._make_snapshot_item(s))
+            self._row_ords.append(_date_ordinal(s.get("date")))
+
+    def _make_snapshot_item(self, s: dict) -> QListWidgetItem:
+        date = s.get("date") or ""
+        filter_type = s.get("filter_type") or s.get("filter") or ""
+        path = s.get("path") or ""
+        text = f"{date} [{filter_type}] | {os.path.basename(path)}"
+        item = QListWidgetItem(text)
+        item.setData(Qt.UserRole, s)
+        return item
+
+    def _on_snapshot_added(self, snap) -> None:
+        # insert the new row in date order instead of reloading all metadata
+        try:
+            current_filter = self.import_widget.current_filter()
+            if current_filter and snap.filter_key != current_filter:
+                return
+            o = snap.date.to_ordinal()
+            row = bisect_right(self._row_ords, o)
+            self.snapshot_list.insertItem(row, self._make_snapshot_item(snap.to_dict()))
+            self._row_ords.insert(row, o)
+        except Exception:
+            self.refresh_snapshots()
+
+    def _reload_snapshots(self) -> None:
+        # snapshots changed outside the import widget: drop its date cache
+        if hasattr(self.import_widget, "invalidate_snapshot_dates"):
+            self.import_widget.invalidate_snapshot_dates()
+        self.refresh_snapshots()
 
     def _selected_snapshot_dicts(self) -> List[dict]:
         result: List[dict] = []
@@ -298,10 +347,13 @@ class CampaignDetailWindow(QWidget):
         snap.date = gd
         snap.filter_type = filt
         camp.snapshots.sort(key=lambda s: s.date.to_ordinal(False))
+        camp.mark_snapshots_changed()
         self.storage.save_campaign(camp)
-        self.refresh_snapshots()
+        self._reload_snapshots()
 
     def _open_player(self) -> None:
+        from chroniclemap.gui.player_window import PlayerWindow
+
         base_root = self.storage.base_dir.parent
         player = PlayerWindow(
             self.campaign_name, storage_base_dir=base_root, parent=None
@@ -321,8 +373,9 @@ class CampaignDetailWindow(QWidget):
         for snap in camp.snapshots:
             if snap.id in selected_ids:
                 snap.filter_type = filt
+        camp.mark_snapshots_changed()
         self.storage.save_campaign(camp)
-        self.refresh_snapshots()
+        self._reload_snapshots()
 
     def _apply_bulk_date_offset(self) -> None:
         selected = self._selected_snapshot_dicts()
@@ -340,16 +393,13 @@ class CampaignDetailWindow(QWidget):
                 snap.date = snap.date.add_days(delta)
             else:
                 new_year = snap.date.year + delta
-                try:
-                    snap.date = GameDate(new_year, snap.date.month, snap.date.day)
-                except Exception:
-                    import calendar
-
-                    mdays = calendar.monthrange(new_year, snap.date.month)[1]
-                    snap.date = GameDate(new_year, snap.date.month, mdays)
+                month = snap.date.month
+                day = min(snap.date.day, days_in_month(new_year, month))
+                snap.date = GameDate(new_year, month, day)
         camp.snapshots.sort(key=lambda s: s.date.to_ordinal(False))
+        camp.mark_snapshots_changed()
         self.storage.save_campaign(camp)
-        self.refresh_snapshots()
+        self._reload_snapshots()
 
     def _delete_selected_snapshots(self) -> None:
         selected = self._selected_snapshot_dicts()
@@ -366,4 +416,4 @@ class CampaignDetailWindow(QWidget):
         camp = self._load_campaign()
         ids = [s.get("id") for s in selected if s.get("id")]
         self.storage.delete_snapshots(camp, ids, delete_files=True)
-        self.refresh_snapshots()
+        self._reload_snapshots()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Optional
+from bisect import bisect_right
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 from PySide6 import QtCore, QtWidgets
 from PySide6.QtGui import QAction
@@ -19,10 +21,12 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from chroniclemap.gui.campaign_detail import CampaignDetailWindow
 from chroniclemap.gui.campaign_store import CampaignStore
 from chroniclemap.gui.texts import get_locale, set_locale, tr
 
+if TYPE_CHECKING:
+    from chroniclemap.gui.campaign_detail import CampaignDetailWindow
+
 
 class NoteEditorDialog(QDialog):
     def __init__(self, parent: Optional[QWidget], initial_text: str = ""):
@@ -100,16 +104,40 @@ class CampaignManagerView(QWidget):
         self.refresh_list()
 
     def refresh_list(self):
-        self.list_widget.clear()
-        for entry in self.store.list_campaigns():
-            name = entry["name"]
-            meta = entry.get("metadata") or {}
-            created = meta.get("created_at") or meta.get("created") or ""
-            item = QtWidgets.QListWidgetItem(
-                f"{name}    ({created[:10] if created else ''})"
-            )
-            item.setData(QtCore.Qt.UserRole, name)
-            self.list_widget.addItem(item)
+        # suppress repaints between clear() and the last addItem()
+        self.list_widget.setUpdatesEnabled(False)
+        try:
+            self.list_widget.clear()
+            # campaign directory of each row, in the store's listing order
+            self._row_paths: list[Path] = []
+            for entry in self.store.list_campaigns():
+                item = self._make_item(entry["name"], entry.get("metadata") or {})
+                self.list_widget.addItem(item)
+                self._row_paths.append(Path(entry["path"]))
+        finally:
+            self.list_widget.setUpdatesEnabled(True)
+
+    def _make_item(self, name: str, meta: dict) -> QtWidgets.QListWidgetItem:
+        created = meta.get("created_at") or meta.get("created") or ""
+        item = QtWidgets.QListWidgetItem(
+            f"{name}    ({created[:10] if created else ''})"
+        )
+        item.setData(QtCore.Qt.UserRole, name)
+        return item
+
+    def _insert_campaign(self, camp) -> None:
+        # place the new row where a full rescan would put it
+        path = Path(camp.path)
+        row = bisect_right(self._row_paths, path)
+        self.list_widget.insertItem(row, self._make_item(camp.name, camp.to_dict()))
+        self._row_paths.insert(row, path)
+
+    def _remove_campaign_row(self, name: str) -> None:
+        for row in range(self.list_widget.count()):
+            if self.list_widget.item(row).data(QtCore.Qt.UserRole) == name:
+                self.list_widget.takeItem(row)
+                del self._row_paths[row]
+                return
 
     def selected_name(self) -> Optional[str]:
         it = self.list_widget.currentItem()
@@ -133,11 +161,15 @@ class CampaignManagerView(QWidget):
         if not ok or not name.strip():
             return
         try:
-            self.store.create_campaign(name.strip())
+            camp = self.store.create_campaign(name.strip())
             self.status.setText(tr("status.campaign_created", name=name.strip()))
-            self.refresh_list()
         except Exception as e:
             QMessageBox.critical(self, tr("common.error"), str(e))
+            return
+        try:
+            self._insert_campaign(camp)
+        except Exception:
+            self.refresh_list()
 
     def on_delete(self):
         nm = self.ensure_selection()
@@ -153,9 +185,13 @@ class CampaignManagerView(QWidget):
             try:
                 self.store.delete_campaign(nm)
                 self.status.setText(tr("status.campaign_deleted", name=nm))
-                self.refresh_list()
             except Exception as e:
                 QMessageBox.critical(self, tr("common.error"), str(e))
+                return
+            try:
+                self._remove_campaign_row(nm)
+            except Exception:
+                self.refresh_list()
 
     def on_rename(self):
         nm = self.ensure_selection()
@@ -193,6 +229,10 @@ class CampaignManagerView(QWidget):
         nm = self.ensure_selection()
         if not nm:
             return
+        # the detail window pulls in the player, importer and OCR; load them
+        # on first open instead of at startup
+        from chroniclemap.gui.campaign_detail import CampaignDetailWindow
+
         detail = CampaignDetailWindow(nm, self.store)
         detail.show()
         self._detail_windows.append(detail)
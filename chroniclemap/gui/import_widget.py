@@ -6,10 +6,9 @@ import tempfile
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import QMimeData, Qt, Signal
-from PySide6.QtGui import QGuiApplication, QPixmap
+from PySide6.QtCore import QMimeData, Qt, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QGuiApplication
 from PySide6.QtWidgets import (
-    QApplication,
     QButtonGroup,
     QComboBox,
     QDialog,
@@ -26,17 +25,23 @@ from PySide6.QtWidgets import (
 )
 
 # use GameDate and FilterType from core.models
-from chroniclemap.core.models import FilterType, GameDate
+from chroniclemap.core.models import FilterType, GameDate, days_in_month
 from chroniclemap.gui.snapshot_confirm import SnapshotConfirmDialog
 from chroniclemap.gui.texts import tr
+from chroniclemap.gui.workers import OCRBatchRunnable
 from chroniclemap.storage.manager import StorageManager
 
+# marker for "OCR has not been attempted for this file yet"
+_OCR_NOT_RUN = object()
+
 
 class ImportWidget(QWidget):
     # 发出一个信号，通知外层“有新的 Snapshot 被导入”，载荷为 Snapshot 对象
     snapshot_added = Signal(object)
     # 当前选中的滤镜发生变化时发出（载荷为滤镜名字符串）
     filter_changed = Signal(str)
+    # 批量导入结束（完成或取消）时发出，载荷为成功导入的数量
+    batch_imported = Signal(int)
 
     def __init__(
         self,
@@ -51,6 +56,14 @@ class ImportWidget(QWidget):
         self.store = campaign_store
         self.storage = storage_manager
         self.ocr = ocr_provider
+        # running batch import: OCR job, progress dialog, files awaiting import
+        self._batch_epoch = 0
+        self._batch_job: Optional[OCRBatchRunnable] = None
+        self._batch_progress: Optional[QProgressDialog] = None
+        self._batch_queue: list = []
+        self._batch_ocr_done = False
+        self._batch_count = 0
+        self._batch_imported = 0
 
         self.setAcceptDrops(True)
         layout = QVBoxLayout()
@@ -79,13 +92,14 @@ class ImportWidget(QWidget):
             rb = QRadioButton(f)
             if i == 0:
                 rb.setChecked(True)
-            self.filter_group.addButton(rb)
+            # the button id is the index into meta_filters
+            self.filter_group.addButton(rb, i)
             self.filter_buttons.append(rb)
             rg_layout.addWidget(rb)
-            # 当某个按钮被勾选时发出 filter_changed 信号
-            rb.toggled.connect(
-                lambda checked, name=f: checked and self.filter_changed.emit(name)
-            )
+        # 当某个按钮被勾选时发出 filter_changed 信号（整组只连一次）
+        self.filter_group.idToggled.connect(
+            lambda i, checked: checked and self._on_filter_selected(meta_filters[i])
+        )
         self.filter_group_box.setLayout(rg_layout)
         layout.addWidget(self.filter_group_box)
 
@@ -122,22 +136,38 @@ class ImportWidget(QWidget):
         self.file_btn.clicked.connect(self.on_choose_file)
         self.batch_btn.clicked.connect(self.on_batch_import)
         self.paste_btn.clicked.connect(self.on_paste)
-        self.interval_spin.valueChanged.connect(
-            lambda _v: self._save_interval_settings()
-        )
+        self.interval_spin.valueChanged.connect(lambda _v: self._on_interval_changed())
         self.interval_unit.currentTextChanged.connect(
-            lambda _u: self._save_interval_settings()
+            lambda _u: self._on_interval_changed()
         )
 
-        # store filters locally
+        # store filters locally; selection and interval are mirrored from the
+        # widgets' change signals so imports never have to query them
         self._filters = meta_filters
+        self._selected_filter = meta_filters[0]
         self._load_interval_settings(meta)
+        # latest snapshot date per filter name, built lazily from metadata
+        self._last_snap_dates: Optional[dict[str, GameDate]] = None
 
     def current_filter(self) -> str:
-        for rb in self.filter_buttons:
-            if rb.isChecked():
-                return rb.text()
-        return self._filters[0]
+        return self._selected_filter
+
+    def _on_filter_selected(self, name: str) -> None:
+        self._selected_filter = name
+        self.filter_changed.emit(name)
+
+    def _get_interval_setting(self) -> tuple[int, str]:
+        return self._interval_value, self._interval_unit
+
+    def _sync_interval_cache(self) -> None:
+        self._interval_value = int(self.interval_spin.value())
+        self._interval_unit = (
+            self.interval_unit.currentData() or self.interval_unit.currentText()
+        )
+
+    def _on_interval_changed(self) -> None:
+        self._sync_interval_cache()
+        self._save_interval_settings()
 
     def on_choose_file(self):
         path, _ = QFileDialog.getOpenFileName(
@@ -166,31 +196,98 @@ class ImportWidget(QWidget):
         progress.setWindowModality(Qt.WindowModal)
         progress.setAutoClose(True)
         progress.setValue(0)
+        progress.canceled.connect(self._finish_batch)
+
+        # OCR core-sized chunks on a pool worker; each chunk is imported in
+        # order on this thread, one file per event-loop turn
+        self._batch_epoch += 1
+        job = OCRBatchRunnable(
+            self._ocr_batch,
+            [Path(p) for p in paths],
+            os.cpu_count() or 1,
+            self._batch_epoch,
+        )
+        job.signals.chunk.connect(self._on_batch_chunk)
+        job.signals.finished.connect(self._on_batch_ocr_finished)
+        self._batch_job = job
+        self._batch_progress = progress
+        self._batch_queue = []
+        self._batch_ocr_done = False
+        self._batch_count = 0
+        self._batch_imported = 0
+        QThreadPool.globalInstance().start(job)
+
+    def _on_batch_chunk(self, epoch: int, paths: list, dates: list) -> None:
+        if epoch != self._batch_epoch or self._batch_job is None:
+            return
+        idle = not self._batch_queue
+        self._batch_queue.extend(zip(paths, dates))
+        if idle:
+            QTimer.singleShot(0, self._import_next_batch_file)
 
-        imported = 0
-        for idx, p in enumerate(paths, start=1):
-            if progress.wasCanceled():
-                break
-            if self._handle_input_path(Path(p), confirm=False):
-                imported += 1
-            progress.setValue(idx)
-            QApplication.processEvents()
+    def _on_batch_ocr_finished(self, epoch: int) -> None:
+        if epoch != self._batch_epoch or self._batch_job is None:
+            return
+        self._batch_ocr_done = True
+        if not self._batch_queue:
+            self._finish_batch()
 
-        self.status_label.setText(tr("import.imported_batch", count=imported))
+    def _import_next_batch_file(self) -> None:
+        if self._batch_job is None or not self._batch_queue:
+            return
+        if self._batch_progress is not None and self._batch_progress.wasCanceled():
+            self._finish_batch()
+            return
+        path, ocr_date = self._batch_queue.pop(0)
+        if self._handle_input_path(path, confirm=False, ocr_date=ocr_date):
+            self._batch_imported += 1
+        self._batch_count += 1
+        if self._batch_progress is not None:
+            self._batch_progress.setValue(self._batch_count)
+        if self._batch_queue:
+            QTimer.singleShot(0, self._import_next_batch_file)
+        elif self._batch_ocr_done:
+            self._finish_batch()
+
+    def cancel_batch(self) -> None:
+        """Stop a running batch import; files already imported are kept."""
+        self._finish_batch()
+
+    def _finish_batch(self) -> None:
+        """End the running batch import, whether it completed or was cancelled."""
+        job = self._batch_job
+        if job is None:
+            return
+        job.cancel()
+        self._batch_job = None
+        self._batch_queue = []
+        progress = self._batch_progress
+        self._batch_progress = None
+        if progress is not None:
+            progress.canceled.disconnect(self._finish_batch)
+            progress.reset()
+        self.status_label.setText(
+            tr("import.imported_batch", count=self._batch_imported)
+        )
+        self.batch_imported.emit(self._batch_imported)
 
     def on_paste(self):
         clipboard = QGuiApplication.clipboard()
         md: QMimeData = clipboard.mimeData()
         if md.hasImage():
             img = clipboard.image()
-            # write to tmp file
+            # write to tmp file straight from the QImage; the import moves it
+            # into the campaign rather than copying it a second time
             tmp = (
                 Path(tempfile.gettempdir())
                 / f"chroniclemap_clip_{int(os.times()[4]*1000)}.png"
             )
-            pix = QPixmap.fromImage(img)
-            pix.save(str(tmp), "PNG")
-            self._handle_input_path(tmp)
+            img.save(str(tmp), "PNG")
+            try:
+                self._handle_input_path(tmp, move_source=True)
+            finally:
+                # cancelled or failed imports leave the dump behind
+                tmp.unlink(missing_ok=True)
         else:
             self.status_label.setText(tr("import.clipboard_empty"))
 
@@ -206,15 +303,35 @@ class ImportWidget(QWidget):
         if path:
             self._handle_input_path(Path(path))
 
-    def _handle_input_path(self, path: Path, *, confirm: bool = True) -> bool:
+    def _ocr_batch(self, paths: list[Path]) -> list:
+        """OCR dates for paths; entries stay _OCR_NOT_RUN without a batch API."""
+        extract_dates = getattr(self.ocr, "extract_dates", None)
+        if extract_dates is None:
+            return [_OCR_NOT_RUN] * len(paths)
+        try:
+            return [d or None for d in extract_dates(paths)]
+        except Exception:
+            return [_OCR_NOT_RUN] * len(paths)
+
+    def _handle_input_path(
+        self,
+        path: Path,
+        *,
+        confirm: bool = True,
+        move_source: bool = False,
+        ocr_date: object = _OCR_NOT_RUN,
+    ) -> bool:
         self.status_label.setText(tr("import.processing"))
-        ocr_date: Optional[str] = None
         predicted_date: Optional[str] = None
         detected_date: Optional[str] = None
+        # batch imports pass the date OCR'd ahead of time (None = nothing found)
+        ocr_done = ocr_date is not _OCR_NOT_RUN
+        if not ocr_done:
+            ocr_date = None
 
         # OCR处理
         try:
-            if self.ocr:
+            if self.ocr and not ocr_done:
                 # 直接使用manager需要的OCR参数格式
                 raw_date = self.ocr.extract_date(
                     path,
@@ -229,10 +346,7 @@ class ImportWidget(QWidget):
         last_date_iso = self._get_last_snapshot_date(self.current_filter())
         if last_date_iso:
             try:
-                num = int(self.interval_spin.value())
-                unit = (
-                    self.interval_unit.currentData() or self.interval_unit.currentText()
-                )
+                num, unit = self._get_interval_setting()
                 predicted_date = self._add_interval_iso(last_date_iso, num, unit)
             except Exception:
                 predicted_date = None
@@ -291,8 +405,10 @@ class ImportWidget(QWidget):
                         date_str=date_value,
                         ocr_provider=self.ocr,  # 传递OCR组件
                         create_dirs_if_missing=True,  # 确保目录创建
+                        move_source=move_source,
                     )
 
+                    self._note_snapshot_date(snap)
                     # 更新UI状态
                     self.status_label.setText(
                         tr("import.imported_single", date=snap.date.to_iso())
@@ -324,7 +440,9 @@ class ImportWidget(QWidget):
                 date_str=detected_date,
                 ocr_provider=self.ocr,
                 create_dirs_if_missing=True,
+                move_source=move_source,
             )
+            self._note_snapshot_date(snap)
             self.status_label.setText(
                 tr("import.imported_single", date=snap.date.to_iso())
             )
@@ -338,17 +456,36 @@ class ImportWidget(QWidget):
             return False
 
     def _get_last_snapshot_date(self, filter_name: str) -> Optional[str]:
+        if self._last_snap_dates is None:
+            self._last_snap_dates = self._build_last_snapshot_dates()
+        last = self._last_snap_dates.get(filter_name)
+        return last.to_iso() if last is not None else None
+
+    def _build_last_snapshot_dates(self) -> dict[str, GameDate]:
         meta = self.store.load_metadata(self.campaign_name) or {}
-        snaps = meta.get("snapshots", [])
-        dates = [
-            s.get("date")
-            for s in snaps
-            if (s.get("filter_type") == filter_name or s.get("filter") == filter_name)
-            and s.get("date")
-        ]
-        if not dates:
-            return None
-        return max(dates)
+        latest: dict[str, GameDate] = {}
+        for s in meta.get("snapshots", []):
+            if not s.get("date"):
+                continue
+            try:
+                d = GameDate.fromiso(s["date"])
+            except Exception:
+                continue
+            for key in {s.get("filter_type"), s.get("filter")}:
+                if key is not None and (key not in latest or d > latest[key]):
+                    latest[key] = d
+        return latest
+
+    def _note_snapshot_date(self, snap) -> None:
+        if self._last_snap_dates is None:
+            return
+        last = self._last_snap_dates.get(snap.filter_key)
+        if last is None or snap.date > last:
+            self._last_snap_dates[snap.filter_key] = snap.date
+
+    def invalidate_snapshot_dates(self) -> None:
+        """Drop cached per-filter dates after snapshots were edited elsewhere."""
+        self._last_snap_dates = None
 
     def _add_interval_iso(self, iso_date: str, num: int, unit: str) -> str:
         """
@@ -365,24 +502,14 @@ class ImportWidget(QWidget):
             total = (m - 1) + num
             ny = y + (total // 12)
             nm = (total % 12) + 1
-            # clamp day to month length via GameDate constructor
-            try:
-                nd = GameDate(ny, nm, d)
-            except Exception:
-                # clamp to last day of month
-                import calendar
-
-                mdays = calendar.monthrange(ny, nm)[1]
-                nd = GameDate(ny, nm, mdays)
+            # clamp to last day of month
+            nd = GameDate(ny, nm, min(d, days_in_month(ny, nm)))
             return nd.to_iso()
         else:  # years
             y, m, d = gd.year, gd.month, gd.day
             ny = y + int(num)
-            try:
-                nd = GameDate(ny, m, d)
-            except Exception:
-                # clamp feb 29 -> feb 28 if needed
-                nd = GameDate(ny, m, min(d, 28))
+            # clamp feb 29 -> feb 28 if needed
+            nd = GameDate(ny, m, min(d, days_in_month(ny, m)))
             return nd.to_iso()
 
     def _load_interval_settings(self, metadata: dict) -> None:
@@ -413,6 +540,7 @@ class ImportWidget(QWidget):
                 self.interval_unit.setCurrentIndex(idx)
         self.interval_spin.blockSignals(False)
         self.interval_unit.blockSignals(False)
+        self._sync_interval_cache()
 
     def _save_interval_settings(self) -> None:
         try:
@@ -420,8 +548,7 @@ class ImportWidget(QWidget):
         except Exception:
             return
 
-        value = int(self.interval_spin.value())
-        unit = self.interval_unit.currentData() or self.interval_unit.currentText()
+        value, unit = self._get_interval_setting()
         days = value
         if unit == "years":
             days = value * 365
@@ -6,8 +6,16 @@ import uuid
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QAction, QColor, QGuiApplication, QPainter, QPen, QPixmap
+from PySide6.QtCore import QElapsedTimer, QSize, Qt, QThreadPool, QTimer
+from PySide6.QtGui import (
+    QAction,
+    QColor,
+    QGuiApplication,
+    QPainter,
+    QPen,
+    QPixmap,
+    QPixmapCache,
+)
 from PySide6.QtWidgets import (
     QComboBox,
     QDialog,
@@ -38,12 +46,44 @@ from chroniclemap.core.models import (
     Rank,
     RankPeriod,
     Ruler,
+    Snapshot,
     new_ruler,
 )
 from chroniclemap.gui.texts import tr
+from chroniclemap.gui.workers import PixmapLoadRunnable, PixmapLoadSignals
 from chroniclemap.storage.manager import StorageManager
 from chroniclemap.temporal.engine import TemporalEngine
 
+# shortest / longest gap between playback ticks
+FRAME_INTERVAL_MS = 40
+IDLE_TICK_MS = 500
+# canvas repaint cadence (~30 FPS)
+PAINT_INTERVAL_MS = 33
+# QPixmapCache budget (KB) for decoded snapshots kept for scrubbing back and forth
+PIXMAP_CACHE_KB = 256 * 1024
+# upcoming snapshots decoded ahead of the playhead
+PREFETCH_AHEAD = 2
+# snapshots decode to the canvas size rounded up to this step, so small
+# resizes keep hitting the cache
+DECODE_STEP_PX = 256
+# idle time before a thumbnail on screen is replaced by the full decode
+FULL_RES_DELAY_MS = 150
+
+# marker for "nothing painted yet", distinct from a frame without a snapshot
+_NOT_PAINTED = object()
+
+
+def _file_stamp(path: str) -> str:
+    """
+    mtime/size tag for pixmap cache keys, so a file re-imported under the
+    same (date-based) name never hits a stale pixmap.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return "-"
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
 
 def _fmt_date(value: Optional[GameDate]) -> str:
     return value.to_iso() if value else "-"
@@ -714,6 +754,8 @@ class PlayerWindow(QWidget):
 
         self.filter_combo = QComboBox()
         self.filter_combo.addItems([f.value for f in FilterType])
+        # mirrored from currentTextChanged so per-frame lookups skip the combo
+        self._filter: Optional[FilterType] = FilterType(self.filter_combo.currentText())
         right.addWidget(QLabel(tr("common.filter")))
         right.addWidget(self.filter_combo)
 
@@ -742,10 +784,57 @@ class PlayerWindow(QWidget):
 
         self._setup_menus()
 
+        # playback clock: a single-shot timer re-armed for the next visible date
+        # change, so nothing wakes up while paused or between slow days
         self._timer = QTimer(self)
-        self._timer.setInterval(40)
+        self._timer.setSingleShot(True)
         self._timer.timeout.connect(self._on_tick)
-        self._timer.start()
+        self._clock = QElapsedTimer()
+
+        # canvas repaints run on their own frame timer; _update_frame only marks
+        # the canvas dirty, so state updates never wait on image decoding
+        self._paint_timer = QTimer(self)
+        self._paint_timer.setSingleShot(True)
+        self._paint_timer.setInterval(PAINT_INTERVAL_MS)
+        self._paint_timer.timeout.connect(self._on_paint_timer)
+        self._canvas_dirty = False
+        self._canvas_path: Optional[str] = None
+        self._canvas_thumb: Optional[str] = None
+        # while scrubbing, uncached snapshots show their import thumbnail and
+        # the full decode starts once the canvas has been idle for a moment
+        self._full_res_timer = QTimer(self)
+        self._full_res_timer.setSingleShot(True)
+        self._full_res_timer.setInterval(FULL_RES_DELAY_MS)
+        self._full_res_timer.timeout.connect(self._start_full_load)
+        self._painted_path: object = _NOT_PAINTED
+        # images decode on the thread pool; results from older epochs are dropped
+        self._load_epoch = 0
+        self._loads: set[PixmapLoadRunnable] = set()
+        # one signal dispatcher per job kind, shared by every decode job; not
+        # parented to the window, so a job still decoding after the window is
+        # deleted emits into a live (disconnected) object rather than a dead one
+        self._load_signals = PixmapLoadSignals()
+        self._load_signals.result.connect(self._on_pixmap_loaded)
+        self._prefetch_signals = PixmapLoadSignals()
+        self._prefetch_signals.result.connect(self._on_pixmap_prefetched)
+        # decoded snapshot pixmaps live in the shared QPixmapCache, keyed by
+        # path, file stamp and decode size; the decode size only ever grows
+        self._decode_size = QSize()
+        # unscaled pixmap on the canvas, rescaled once per burst of resizes
+        self._shown_pix: Optional[QPixmap] = None
+        self._fit_pending = False
+        if QPixmapCache.cacheLimit() < PIXMAP_CACHE_KB:
+            QPixmapCache.setCacheLimit(PIXMAP_CACHE_KB)
+        # read-ahead decodes in flight, by path
+        self._prefetching: dict[str, PixmapLoadRunnable] = {}
+        # last snapshot lookup keyed by (day ordinal, filter), and the day shown
+        self._lookup_key: Optional[tuple] = None
+        self._lookup_snap: Optional[Snapshot] = None
+        self._shown_ord: Optional[int] = None
+        # snapshot path behind the label/canvas; "" until the first frame
+        self._label_path: Optional[str] = ""
+        # several state changes within one event loop pass refresh the frame once
+        self._frame_pending = False
 
         self.play_btn.clicked.connect(self._on_play)
         self.pause_btn.clicked.connect(self._on_pause)
@@ -760,7 +849,7 @@ class PlayerWindow(QWidget):
         self.timeline_slider.valueChanged.connect(self._on_slider_changed)
         self.current_date_jump_btn.clicked.connect(self._on_date_jump)
         self.current_date_edit.returnPressed.connect(self._on_date_jump)
-        self.filter_combo.currentTextChanged.connect(lambda _txt: self._update_frame())
+        self.filter_combo.currentTextChanged.connect(self._on_filter_changed)
         self.save_note_btn.clicked.connect(self._on_save_note)
         self.ruler_prev_btn.clicked.connect(self._on_prev_ruler)
         self.ruler_next_btn.clicked.connect(self._on_next_ruler)
@@ -773,6 +862,20 @@ class PlayerWindow(QWidget):
         self._update_frame()
         self._refresh_ruler_card()
 
+    def closeEvent(self, event) -> None:
+        self._timer.stop()
+        self._paint_timer.stop()
+        self._full_res_timer.stop()
+        # drop decodes that have not started; running ones stay referenced
+        # until they finish, and their results are ignored
+        pool = QThreadPool.globalInstance()
+        self._load_epoch += 1
+        self._loads = {j for j in self._loads if not pool.tryTake(j)}
+        for path, job in list(self._prefetching.items()):
+            if pool.tryTake(job):
+                del self._prefetching[path]
+        super().closeEvent(event)
+
     def _setup_menus(self) -> None:
         tools_menu = self.menu_bar.addMenu(tr("menu.tools"))
         export_menu = tools_menu.addMenu(tr("menu.export"))
@@ -829,45 +932,63 @@ class PlayerWindow(QWidget):
         self._update_timeline_label()
 
     def _current_filter(self) -> Optional[FilterType]:
+        return self._filter
+
+    def _on_filter_changed(self, text: str) -> None:
         try:
-            return FilterType(self.filter_combo.currentText())
+            self._filter = FilterType(text)
         except Exception:
-            return None
+            self._filter = None
+        self._request_frame()
 
     def _on_play(self) -> None:
         self.engine.play()
+        self._clock.start()
+        self._schedule_tick()
 
     def _on_pause(self) -> None:
         self.engine.pause()
+        self._timer.stop()
+
+    def _schedule_tick(self) -> None:
+        wait = self.engine.seconds_until_next_day()
+        if wait is None:
+            # stalled speed: poll slowly so a speed change resumes playback
+            delay = IDLE_TICK_MS
+        else:
+            delay = min(max(int(wait * 1000), FRAME_INTERVAL_MS), IDLE_TICK_MS)
+        self._timer.start(delay)
 
     def _on_prev_snapshot(self) -> None:
         cur = self.engine.get_current_date()
         flt = self._current_filter()
         prev = None
         for s in self.campaign.snapshots:
-            if flt and s.filter_type != flt:
+            if flt and s.filter_type is not flt:
                 continue
             if s.date < cur and (prev is None or s.date > prev.date):
                 prev = s
         if prev:
             self.engine.seek(prev.date)
-            self._update_frame()
+            self._request_frame()
 
     def _on_next_snapshot(self) -> None:
         nxt = self.engine.step_to_next_snapshot(filter_type=self._current_filter())
         if nxt:
-            self._update_frame()
+            self._request_frame()
 
     def _on_speed_changed(self, value: float, unit: str) -> None:
         self.engine.set_playback_speed(unit, value)
         self.campaign.config.playback_speed = {"units": unit, "value": value}
         self.storage.save_campaign(self.campaign)
+        if self.engine.playing:
+            self._schedule_tick()
 
     def _on_slider_changed(self, value: int) -> None:
         if not hasattr(self, "_ord_min"):
             return
         self.engine.seek(GameDate.from_ordinal(value, ignore_leap=False))
-        self._update_frame()
+        self._request_frame()
 
     def _on_date_jump(self) -> None:
         text = self.current_date_edit.text().strip()
@@ -879,13 +1000,16 @@ class PlayerWindow(QWidget):
             self.current_date_edit.setStyleSheet("border: 1px solid #cc3333;")
             return
         self.current_date_edit.setStyleSheet("")
-        self._update_frame()
+        # rewrite the typed text in canonical form even if the day is unchanged
+        self._shown_ord = None
+        self._request_frame()
 
     def _on_tick(self) -> None:
         if not self.engine.playing:
             return
-        self.engine.tick(self._timer.interval() / 1000.0)
-        self._update_frame()
+        self.engine.tick(self._clock.restart() / 1000.0)
+        self._request_frame()
+        self._schedule_tick()
 
     def _on_save_note(self) -> None:
         self.campaign.notes = self.note_edit.toPlainText()
@@ -1137,39 +1261,183 @@ class PlayerWindow(QWidget):
         self.ruler_summary.setText("\n".join(lines))
         self.ruler_timeline.set_rulers(self.campaign.rulers)
 
+    def _request_frame(self) -> None:
+        if not self._frame_pending:
+            self._frame_pending = True
+            QTimer.singleShot(0, self._flush_frame)
+
+    def _flush_frame(self) -> None:
+        self._frame_pending = False
+        self._update_frame()
+
     def _update_frame(self) -> None:
         cur_date = self.engine.get_current_date()
-        snap = self.engine.get_snapshot_for(
-            d=cur_date,
-            filter_type=self._current_filter(),
-            prefer_latest_before=True,
-        )
-        if hasattr(self, "_ord_min"):
-            self.timeline_slider.blockSignals(True)
-            self.timeline_slider.setValue(cur_date.to_ordinal(False))
-            self.timeline_slider.blockSignals(False)
-        self._update_timeline_label()
-
-        self.current_date_edit.blockSignals(True)
-        self.current_date_edit.setText(cur_date.to_iso())
-        self.current_date_edit.blockSignals(False)
-        self.ruler_timeline.set_current_ordinal(cur_date.to_ordinal(False))
-
-        if snap:
-            self.current_snapshot_label.setText(os.path.basename(snap.path))
-            pix = QPixmap(snap.path)
-            if not pix.isNull():
-                pix = pix.scaled(
-                    self.image_label.size(),
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation,
-                )
-                self.image_label.setPixmap(pix)
+        cur_ord = cur_date.to_ordinal(False)
+        key = (cur_ord, self._current_filter())
+        if key != self._lookup_key:
+            self._lookup_snap = self.engine.get_snapshot_for(
+                d=cur_date,
+                filter_type=key[1],
+                prefer_latest_before=True,
+            )
+            self._lookup_key = key
+        snap = self._lookup_snap
+
+        if cur_ord != self._shown_ord:
+            self._shown_ord = cur_ord
+            if hasattr(self, "_ord_min"):
+                self.timeline_slider.blockSignals(True)
+                self.timeline_slider.setValue(cur_ord)
+                self.timeline_slider.blockSignals(False)
+
+            self.current_date_edit.blockSignals(True)
+            self.current_date_edit.setText(cur_date.to_iso())
+            self.current_date_edit.blockSignals(False)
+            self.ruler_timeline.set_current_ordinal(cur_ord)
+
+        path = snap.path if snap else None
+        if path != self._label_path:
+            self._label_path = path
+            if path:
+                self.current_snapshot_label.setText(os.path.basename(path))
             else:
-                self.image_label.setText(tr("player.image_na"))
-        else:
-            self.current_snapshot_label.setText(tr("player.snapshot_na"))
+                self.current_snapshot_label.setText(tr("player.snapshot_na"))
+            self._mark_canvas(path, snap.thumbnail if snap else None)
+
+    def _mark_canvas(self, path: Optional[str], thumb: Optional[str] = None) -> None:
+        self._canvas_path = path
+        self._canvas_thumb = thumb
+        self._canvas_dirty = path != self._painted_path
+        if self._canvas_dirty and not self._paint_timer.isActive():
+            self._paint_timer.start()
+
+    def _on_paint_timer(self) -> None:
+        if not self._canvas_dirty:
+            return
+        self._canvas_dirty = False
+        self._full_res_timer.stop()
+        path = self._canvas_path
+        self._painted_path = path
+        self._load_epoch += 1
+        self._grow_decode_size()
+        pix = None if path is None else QPixmapCache.find(self._cache_key(path))
+        if path is None:
+            self._shown_pix = None
             self.image_label.setText(tr("player.no_snapshot_date"))
+        elif pix is not None:
+            self._show_pixmap(pix)
+        else:
+            thumb = self._thumb_pixmap(self._canvas_thumb)
+            if thumb is not None:
+                self._show_pixmap(thumb)
+                self._full_res_timer.start()
+            else:
+                self._start_full_load()
+        self._prefetch_upcoming()
+
+    def _thumb_pixmap(self, thumb: Optional[str]) -> Optional[QPixmap]:
+        if not thumb:
+            return None
+        key = f"{thumb}#{_file_stamp(thumb)}"
+        pix = QPixmapCache.find(key)
+        if pix is None:
+            pix = QPixmap(thumb)
+            if pix.isNull():
+                return None
+            QPixmapCache.insert(key, pix)
+        return pix
+
+    def _start_full_load(self) -> None:
+        path = self._painted_path
+        if not isinstance(path, str):
+            return
+        job = PixmapLoadRunnable(
+            path, self._load_epoch, self._decode_size, self._load_signals
+        )
+        # keep the Python wrapper alive until its result has been delivered
+        self._loads.add(job)
+        QThreadPool.globalInstance().start(job)
+
+    def _prefetch_upcoming(self) -> None:
+        for snap in self.engine.peek_next_snapshots(
+            self._current_filter(), k=PREFETCH_AHEAD
+        ):
+            path = snap.path
+            if path in self._prefetching:
+                continue
+            if QPixmapCache.find(self._cache_key(path)) is not None:
+                continue
+            job = PixmapLoadRunnable(
+                path, -1, self._decode_size, self._prefetch_signals
+            )
+            self._prefetching[path] = job
+            QThreadPool.globalInstance().start(job)
+
+    def _on_pixmap_prefetched(self, _epoch: int, path: str, img) -> None:
+        job = self._prefetching.pop(path, None)
+        if job is None or img.isNull():
+            return
+        key = self._cache_key(path, job.max_size)
+        if QPixmapCache.find(key) is None:
+            QPixmapCache.insert(key, QPixmap.fromImage(img))
+
+    def _on_pixmap_loaded(self, epoch: int, path: str, img) -> None:
+        job = next((j for j in self._loads if j.epoch == epoch), None)
+        self._loads = {j for j in self._loads if j.epoch > epoch}
+        if epoch != self._load_epoch:
+            return
+        if img.isNull():
+            self._shown_pix = None
+            self.image_label.setText(tr("player.image_na"))
+            return
+        pix = QPixmap.fromImage(img)
+        if job is not None:
+            QPixmapCache.insert(self._cache_key(path, job.max_size), pix)
+        self._show_pixmap(pix)
+
+    def _cache_key(self, path: str, size: Optional[QSize] = None) -> str:
+        size = self._decode_size if size is None else size
+        return f"{path}@{size.width()}x{size.height()}#{_file_stamp(path)}"
+
+    def _grow_decode_size(self) -> bool:
+        """Round the canvas size up to DECODE_STEP_PX; True if it grew."""
+        label = self.image_label.size()
+        w = -(-label.width() // DECODE_STEP_PX) * DECODE_STEP_PX
+        h = -(-label.height() // DECODE_STEP_PX) * DECODE_STEP_PX
+        cur = self._decode_size
+        if w <= cur.width() and h <= cur.height():
+            return False
+        self._decode_size = QSize(max(w, cur.width()), max(h, cur.height()))
+        return True
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        if hasattr(self, "_fit_pending"):
+            self._request_fit()
+
+    def _request_fit(self) -> None:
+        if not self._fit_pending:
+            self._fit_pending = True
+            QTimer.singleShot(0, self._do_fit)
+
+    def _do_fit(self) -> None:
+        self._fit_pending = False
+        # a bigger canvas needs a sharper decode of the current snapshot
+        if self._grow_decode_size() and self._canvas_path is not None:
+            self._painted_path = _NOT_PAINTED
+            self._mark_canvas(self._canvas_path, self._canvas_thumb)
+        if self._shown_pix is not None:
+            self._show_pixmap(self._shown_pix)
+
+    def _show_pixmap(self, pix: QPixmap) -> None:
+        self._shown_pix = pix
+        self.image_label.setPixmap(
+            pix.scaled(
+                self.image_label.size(),
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation,
+            )
+        )
 
     def _update_timeline_label(self) -> None:
         if not hasattr(self, "_ord_min") or not hasattr(self, "_ord_max"):
@@ -3,8 +3,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import List, Optional
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import QSize, Qt, QTimer
+from PySide6.QtGui import QImageReader, QPixmap
 from PySide6.QtWidgets import (
     QComboBox,
     QDialog,
@@ -21,6 +21,8 @@ from PySide6.QtWidgets import (
 from chroniclemap.core.models import FilterType, GameDate
 from chroniclemap.gui.texts import tr
 
+PREVIEW_SIZE = 320
+
 
 class SnapshotConfirmDialog(QDialog):
     def __init__(
@@ -35,6 +37,9 @@ class SnapshotConfirmDialog(QDialog):
         self.setWindowTitle(tr("snapshot_confirm.title"))
         self.resize(700, 420)
         self.src_path = Path(src_path)
+        # fixed for the dialog's lifetime; reused by every filename preview update
+        self._preview_ext = self.src_path.suffix or ".png"
+        self._invalid_tag = tr("snapshot_confirm.invalid_date_tag")
         self.campaign_name = campaign_name
         self.filters = [
             f.value if isinstance(f, FilterType) else str(f) for f in filters
@@ -50,12 +55,7 @@ class SnapshotConfirmDialog(QDialog):
         self.preview_label = QLabel()
         self.preview_label.setAlignment(Qt.AlignCenter)
         self.preview_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        pix = QPixmap(str(self.src_path))
-        if not pix.isNull():
-            pix = pix.scaled(320, 320, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.preview_label.setPixmap(pix)
-        else:
-            self.preview_label.setText(tr("snapshot_confirm.preview_na"))
+        self._set_preview_pixmap(self.src_path)
         left.addWidget(self.preview_label)
 
         right.addWidget(QLabel(tr("snapshot_confirm.filter")))
@@ -86,8 +86,10 @@ class SnapshotConfirmDialog(QDialog):
         right.addWidget(self.validation_label)
 
         right.addWidget(QLabel(tr("snapshot_confirm.filename_preview")))
-        self.filename_preview = QLineEdit()
-        self.filename_preview.setReadOnly(True)
+        # static text: a selectable label is far lighter than a read-only editor
+        self.filename_preview = QLabel()
+        self.filename_preview.setTextFormat(Qt.PlainText)
+        self.filename_preview.setTextInteractionFlags(Qt.TextSelectableByMouse)
         right.addWidget(self.filename_preview)
 
         right.addWidget(QLabel(tr("snapshot_confirm.note")))
@@ -108,14 +110,45 @@ class SnapshotConfirmDialog(QDialog):
         self.setLayout(layout)
 
         self.filter_combo.currentTextChanged.connect(self._update_filename_preview)
-        self.date_input.textChanged.connect(self._on_date_changed)
+        # coalesce keystroke bursts into one validation/preview update
+        self._date_timer = QTimer(self)
+        self._date_timer.setSingleShot(True)
+        self._date_timer.setInterval(80)
+        self._date_timer.timeout.connect(self._on_date_changed)
+        self.date_input.textChanged.connect(lambda _t: self._date_timer.start())
         self.cancel_btn.clicked.connect(self.reject)
         self.save_btn.clicked.connect(self.on_save)
         self.use_ocr_btn.clicked.connect(self._apply_ocr_candidate)
         self.use_pred_btn.clicked.connect(self._apply_predicted_candidate)
         self._on_date_changed()
 
+    def _set_preview_pixmap(self, path: Path) -> None:
+        pix = self._load_preview(str(path))
+        if pix.isNull():
+            self.preview_label.setText(tr("snapshot_confirm.preview_na"))
+        else:
+            self.preview_label.setPixmap(pix)
+
+    @staticmethod
+    def _load_preview(path: str) -> QPixmap:
+        # decode at ~2x the preview size so large maps never load at full res
+        reader = QImageReader(path)
+        reader.setAutoTransform(True)
+        src = reader.size()
+        limit = QSize(PREVIEW_SIZE * 2, PREVIEW_SIZE * 2)
+        if src.isValid() and (
+            src.width() > limit.width() or src.height() > limit.height()
+        ):
+            reader.setScaledSize(src.scaled(limit, Qt.KeepAspectRatio))
+        img = reader.read()
+        if img.isNull():
+            return QPixmap()
+        return QPixmap.fromImage(img).scaled(
+            PREVIEW_SIZE, PREVIEW_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation
+        )
+
     def _on_date_changed(self):
+        self._date_timer.stop()
         txt = self.date_input.text().strip()
         if not txt:
             self._set_invalid(tr("snapshot_confirm.date_empty"))
@@ -146,14 +179,10 @@ class SnapshotConfirmDialog(QDialog):
         self._update_filename_preview_from_iso(iso)
 
     def _update_filename_preview_from_iso(self, iso: Optional[str]):
-        filt = self.filter_combo.currentText()
-        ext = self.src_path.suffix or ".png"
-        if iso:
-            self.filename_preview.setText(f"maps/{filt}/{iso}{ext}")
-        else:
-            self.filename_preview.setText(
-                f"maps/{filt}/{tr('snapshot_confirm.invalid_date_tag')}{ext}"
-            )
+        self.filename_preview.setText(
+            f"maps/{self.filter_combo.currentText()}/"
+            f"{iso or self._invalid_tag}{self._preview_ext}"
+        )
 
     def set_candidates(
         self, ocr_date: Optional[str], predicted_date: Optional[str]
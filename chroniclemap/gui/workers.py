@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QSize, Qt, Signal
+from PySide6.QtGui import QImageReader
+
+
+class PixmapLoadSignals(QObject):
+    # payload: (epoch, path, QImage); the image is null if decoding failed
+    result = Signal(int, str, object)
+
+
+class PixmapLoadRunnable(QRunnable):
+    """
+    Decode an image file into a QImage on a QThreadPool worker.
+
+    QPixmap may only be created on the GUI thread, so the receiver converts
+    the QImage with QPixmap.fromImage. The epoch is echoed back so the caller
+    can drop results that were superseded while decoding. With max_size set,
+    larger images are scaled down by the decoder itself (keeping the aspect
+    ratio), so a 4K scan shown in a small view never decodes at full size.
+    Callers starting many jobs can pass one shared PixmapLoadSignals instead
+    of paying for a QObject per job.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        epoch: int,
+        max_size: Optional[QSize] = None,
+        signals: Optional[PixmapLoadSignals] = None,
+    ):
+        super().__init__()
+        self.path = path
+        self.epoch = epoch
+        self.max_size = max_size
+        self.signals = signals if signals is not None else PixmapLoadSignals()
+
+    def run(self) -> None:
+        reader = QImageReader(self.path)
+        if self.max_size is not None and not self.max_size.isEmpty():
+            orig = reader.size()
+            if orig.isValid() and (
+                orig.width() > self.max_size.width()
+                or orig.height() > self.max_size.height()
+            ):
+                reader.setScaledSize(orig.scaled(self.max_size, Qt.KeepAspectRatio))
+        img = reader.read()
+        self.signals.result.emit(self.epoch, self.path, img)
+
+
+class OCRBatchSignals(QObject):
+    # payload: (epoch, paths, dates) for every OCR'd chunk, in input order
+    chunk = Signal(int, object, object)
+    # payload: epoch; emitted once after the last chunk or after cancel()
+    finished = Signal(int)
+
+
+class OCRBatchRunnable(QRunnable):
+    """
+    Run a batch OCR callable over paths chunk by chunk on a QThreadPool worker.
+
+    Each chunk's dates are reported through signals.chunk as soon as they are
+    ready, so the GUI thread can import those files while the next chunk is
+    still being recognised. cancel() stops the job before the next chunk.
+    """
+
+    def __init__(
+        self,
+        ocr_batch: Callable[[list[Path]], list],
+        paths: list[Path],
+        chunk_size: int,
+        epoch: int,
+    ):
+        super().__init__()
+        self.ocr_batch = ocr_batch
+        self.paths = paths
+        self.chunk_size = max(chunk_size, 1)
+        self.epoch = epoch
+        self.signals = OCRBatchSignals()
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def run(self) -> None:
+        for start in range(0, len(self.paths), self.chunk_size):
+            if self._cancelled:
+                break
+            batch = self.paths[start : start + self.chunk_size]
+            self.signals.chunk.emit(self.epoch, batch, self.ocr_batch(batch))
+        self.signals.finished.emit(self.epoch)
@@ -1,12 +1,17 @@
 # chroniclemap/storage/manager.py
 from __future__ import annotations
 
+import copy
+import errno
+import json
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Iterable, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
 
-from PIL import Image
+from PIL import Image, features
 
 from chroniclemap.core.models import (
     Campaign,
@@ -17,6 +22,12 @@ from chroniclemap.core.models import (
     new_snapshot,
 )
 
+try:
+    # optional: faster metadata.json encode/decode
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
 if TYPE_CHECKING:
     from chroniclemap.vision.ocr import OCRProvider
 
@@ -27,17 +38,44 @@ MAPS_DIRNAME = "maps"
 THUMBS_DIRNAME = "thumbnails"
 RULERS_DIRNAME = "rulers"
 RULER_PORTRAITS_DIRNAME = "portraits"
-
-
-def _atomic_write(path: Path, data: str) -> None:
+# thumbnails shrink by whole factors first (JPEG DCT scaling / box reduce)
+# down to this multiple of the target size, then finish with Lanczos
+THUMB_REDUCING_GAP = 2.0
+# thumbnails are written once and read on every scrub: WebP at the slowest,
+# smallest encoder setting, or JPEG when Pillow was built without libwebp
+if features.check("webp"):
+    THUMB_EXT = ".webp"
+    THUMB_SAVE_ARGS: Dict[str, Any] = {"format": "WEBP", "quality": 85, "method": 6}
+else:
+    THUMB_EXT = ".jpg"
+    THUMB_SAVE_ARGS = {"format": "JPEG", "quality": 85}
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
     """
-    Atomically write text data to path. Write to temporary then replace.
+    Atomically write data to path. Write to temporary then replace.
     """
     tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(data, encoding="utf-8")
+    tmp.write_bytes(data)
     tmp.replace(path)
 
 
+def _encode_campaign(campaign: Campaign) -> bytes:
+    """UTF-8 JSON for metadata.json, via orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(campaign.to_dict(), option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # e.g. non-string keys in user meta; stdlib json coerces those
+            pass
+    return campaign.to_json().encode("utf-8")
+
+
+def _decode_campaign(raw: bytes) -> Campaign:
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return Campaign.from_dict(data)
+
+
 def _ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
@@ -59,7 +97,7 @@ def create_campaign_on_disk(base_dir: Path, campaign: Campaign) -> Path:
     campaign.modified_at = campaign.modified_at or ""
     # write metadata
     meta_path = campaign_root / META_FILENAME
-    _atomic_write(meta_path, campaign.to_json())
+    _atomic_write(meta_path, _encode_campaign(campaign))
     return campaign_root
 
 
@@ -70,8 +108,7 @@ def load_campaign_from_disk(campaign_root: Path) -> Campaign:
     meta_path = campaign_root / META_FILENAME
     if not meta_path.exists():
         raise FileNotFoundError(f"{meta_path} not found")
-    data = meta_path.read_text(encoding="utf-8")
-    camp = Campaign.from_json(data)
+    camp = _decode_campaign(meta_path.read_bytes())
     camp.path = str(campaign_root)
     return camp
 
@@ -86,7 +123,26 @@ def save_campaign_to_disk(campaign: Campaign) -> None:
     campaign_root = Path(campaign.path)
     _ensure_dir(campaign_root)
     meta_path = campaign_root / META_FILENAME
-    _atomic_write(meta_path, campaign.to_json())
+    _atomic_write(meta_path, _encode_campaign(campaign))
+
+
+def _clone_campaign(campaign: Campaign) -> Campaign:
+    """
+    Independent copy of campaign, much cheaper than re-parsing metadata.json.
+    GameDate is immutable and shared; every mutable container is copied.
+    """
+    clone = copy.copy(campaign)
+    clone.config = copy.deepcopy(campaign.config)
+    snapshots = []
+    for s in campaign.snapshots:
+        snap = copy.copy(s)
+        snap.align = copy.copy(s.align)
+        snap.extra = copy.deepcopy(s.extra)
+        snapshots.append(snap)
+    clone.snapshots = snapshots
+    clone.rulers = copy.deepcopy(campaign.rulers)
+    clone.meta = copy.deepcopy(campaign.meta)
+    return clone
 
 
 def _make_image_filename(
@@ -98,40 +154,98 @@ def _make_image_filename(
     return f"{base}{ext}"
 
 
-def _safe_copy_image_to_target(src: Path, target_dir: Path, date_iso: str) -> Path:
+def _move_onto(src: Path, dst: Path) -> None:
+    """
+    Move src over the existing placeholder dst. os.replace overwrites on every
+    platform (shutil.move would fall back to copying on Windows); only a
+    cross-device move needs the copy + unlink.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        shutil.copyfile(src, dst)
+        os.unlink(src)
+
+
+def _safe_copy_image_to_target(
+    src: Path, target_dir: Path, date_iso: str, *, move: bool = False
+) -> Path:
     """
     Copy src into target_dir using name date_iso + extension.
-    If file exists, append -N suffix.
+    If file exists, append -N suffix. With move=True the source is moved instead.
     Returns the new Path.
     """
     _ensure_dir(target_dir)
     ext = src.suffix or ".png"
-    candidate = target_dir / _make_image_filename(date_iso, ext=ext, suffix=None)
-    suffix = 1
-    while candidate.exists():
+    suffix = None
+    while True:
         candidate = target_dir / _make_image_filename(date_iso, ext=ext, suffix=suffix)
-        suffix += 1
-    shutil.copy2(src, candidate)
+        try:
+            # reserve the name atomically so parallel imports never collide
+            with open(candidate, "xb"):
+                break
+        except FileExistsError:
+            suffix = 1 if suffix is None else suffix + 1
+    try:
+        if move:
+            _move_onto(src, candidate)
+        else:
+            shutil.copyfile(src, candidate)
+    except BaseException:
+        # drop the reserved placeholder
+        candidate.unlink(missing_ok=True)
+        raise
     return candidate
 
 
+def _render_thumbnail(
+    image_path: Path, size: Tuple[int, int] = (400, 400)
+) -> Optional[Image.Image]:
+    """
+    Decode image_path into an in-memory RGB thumbnail. Returns None if Pillow
+    cannot read it.
+    """
+    try:
+        with Image.open(image_path) as im:
+            if im.format == "JPEG":
+                # let libjpeg decode straight to RGB at reduced scale
+                im.draft(
+                    "RGB",
+                    (
+                        int(size[0] * THUMB_REDUCING_GAP),
+                        int(size[1] * THUMB_REDUCING_GAP),
+                    ),
+                )
+            im.thumbnail(size, Image.LANCZOS, reducing_gap=THUMB_REDUCING_GAP)
+            return im.convert("RGB")
+    except Exception:
+        return None
+
+
 def _make_thumbnail(
-    image_path: Path, thumbs_dir: Path, size: Tuple[int, int] = (400, 400)
+    image_path: Path,
+    thumbs_dir: Path,
+    size: Tuple[int, int] = (400, 400),
+    thumb: Optional[Image.Image] = None,
 ) -> Path:
     """
     Create thumbnail for image_path under thumbs_dir. Returns thumbnail path (relative to campaign root).
+    thumb may be a thumbnail already rendered by _render_thumbnail.
     """
     _ensure_dir(thumbs_dir)
-    thumb_name = image_path.stem + ".jpg"
+    thumb_name = image_path.stem + THUMB_EXT
     thumb_path = thumbs_dir / thumb_name
+    if thumb is None:
+        thumb = _render_thumbnail(image_path, size)
     try:
-        with Image.open(image_path) as im:
-            im.thumbnail(size)
-            # save as JPEG for smaller size
-            im.convert("RGB").save(thumb_path, format="JPEG", quality=85)
+        if thumb is None:
+            raise OSError(f"cannot decode {image_path}")
+        thumb.save(thumb_path, **THUMB_SAVE_ARGS)
     except Exception:
         # if PIL fails, fallback to copying original (not ideal)
-        shutil.copy2(image_path, thumb_path)
+        shutil.copyfile(image_path, thumb_path)
     return thumb_path
 
 
@@ -145,32 +259,73 @@ def import_image_into_campaign(
     ocr_provider: Optional["OCRProvider"] = None,
     ocr_roi_spec: Optional[Any] = None,
     ocr_template_key: Optional[str] = None,
+    move_source: bool = False,
 ) -> Snapshot:
     """
     Import an image file into campaign, with optional OCR step to auto-detect date.
     If date_str is None and ocr_provider provided, try OCR first.
+    With move_source=True the source file (e.g. a temporary clipboard dump) is
+    moved into the campaign instead of copied.
+    """
+    snap = _prepare_import(
+        campaign,
+        src_path,
+        filter_type,
+        date_str,
+        create_dirs_if_missing=create_dirs_if_missing,
+        ocr_provider=ocr_provider,
+        ocr_roi_spec=ocr_roi_spec,
+        ocr_template_key=ocr_template_key,
+        move_source=move_source,
+    )
+    campaign.add_snapshot(snap)
+    save_campaign_to_disk(campaign)
+    return snap
+
+
+def _prepare_import(
+    campaign: Campaign,
+    src_path: Path,
+    filter_type: FilterType | str,
+    date_str: Optional[str],
+    *,
+    create_dirs_if_missing: bool,
+    ocr_provider: Optional["OCRProvider"],
+    ocr_roi_spec: Optional[Any],
+    ocr_template_key: Optional[str],
+    move_source: bool,
+) -> Snapshot:
+    """
+    File-side half of an import: date detection, copy and thumbnail.
+    Returns the new Snapshot without touching campaign.snapshots, so it is
+    safe to run on worker threads.
     """
     # if no campaign.path set error
     if not campaign.path:
         raise ValueError("campaign.path must be set before importing images")
     # try OCR if requested and date not provided
+    thumb = None
     if date_str is None and ocr_provider is not None:
-        try:
-            maybe = ocr_provider.extract_date(
-                src_path, roi_spec=ocr_roi_spec, template_key=ocr_template_key
-            )
-            if maybe:
-                date_str = maybe
-        except Exception:
-            # OCR failure should not crash import; fallback to mtime
-            date_str = None
+        # the target file name depends on the date, but the thumbnail decode
+        # does not: render it from the source on a helper thread while OCR
+        # runs here, where any per-thread Tesseract state already lives
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            thumb_future = pool.submit(_render_thumbnail, src_path)
+            try:
+                maybe = ocr_provider.extract_date(
+                    src_path, roi_spec=ocr_roi_spec, template_key=ocr_template_key
+                )
+                if maybe:
+                    date_str = maybe
+            except Exception:
+                # OCR failure should not crash import; fallback to mtime
+                date_str = None
+            thumb = thumb_future.result()
 
     # fallback to file mtime when no date provided
     if date_str is None:
         stat = src_path.stat()
         dt = stat.st_mtime
-        from datetime import datetime, timezone
-
         py_date = datetime.fromtimestamp(dt, tz=timezone.utc).date()
         date_obj = GameDate(py_date.year, py_date.month, py_date.day)
     else:
@@ -194,16 +349,16 @@ def import_image_into_campaign(
     if create_dirs_if_missing:
         _ensure_dir(target_filter_dir)
 
-    dest_path = _safe_copy_image_to_target(src_path, target_filter_dir, date_iso)
-    thumb_path = _make_thumbnail(dest_path, thumbs_root)
+    dest_path = _safe_copy_image_to_target(
+        src_path, target_filter_dir, date_iso, move=move_source
+    )
+    thumb_path = _make_thumbnail(dest_path, thumbs_root, thumb=thumb)
     snap = new_snapshot(
         date_str=date_obj,
         filter_type=filter_type,
         path=str(dest_path),
         thumbnail=str(thumb_path),
     )
-    campaign.add_snapshot(snap)
-    save_campaign_to_disk(campaign)
     return snap
 
 
@@ -222,6 +377,35 @@ class StorageManager:
         """
         self.base_dir = Path(base_dir / "Campaigns")
         _ensure_dir(self.base_dir)
+        # resolved campaign root -> (metadata.json stat signature, parsed campaign)
+        self._campaign_cache: Dict[Path, Tuple[Tuple[int, int, int], Campaign]] = {}
+
+    @staticmethod
+    def _meta_signature(campaign_root: Path) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(campaign_root / META_FILENAME)
+        except OSError:
+            return None
+        # atomic writes replace the file, so the inode changes on every save
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _load_cached(self, campaign_root: Path) -> Campaign:
+        """
+        load_campaign_from_disk, skipping the JSON parse while metadata.json is
+        unchanged. Callers always get their own copy and may mutate it freely.
+        """
+        sig = self._meta_signature(campaign_root)
+        if sig is None:
+            return load_campaign_from_disk(campaign_root)
+        key = campaign_root.resolve()
+        hit = self._campaign_cache.get(key)
+        if hit is not None and hit[0] == sig:
+            camp = _clone_campaign(hit[1])
+        else:
+            camp = load_campaign_from_disk(campaign_root)
+            self._campaign_cache[key] = (sig, _clone_campaign(camp))
+        camp.path = str(campaign_root)
+        return camp
 
     def create_campaign(self, name: str) -> Campaign:
         camp = new_campaign(name=name, path=None)
@@ -235,17 +419,17 @@ class StorageManager:
         # 情况1：如果是绝对路径，直接加载
         if p.is_absolute():
             if p.exists():
-                return load_campaign_from_disk(p)
+                return self._load_cached(p)
             raise FileNotFoundError(f"Campaign not found at {p}")
 
         # 情况2：如果是相对路径且当前目录存在（向后兼容/显式路径）
         if p.exists():
-            return load_campaign_from_disk(p)
+            return self._load_cached(p)
 
         # 情况3：在 base_dir/Campaigns 下查找（新标准位置）
         candidate = self.base_dir / p
         if candidate.exists():
-            return load_campaign_from_disk(candidate)
+            return self._load_cached(candidate)
 
         raise FileNotFoundError(
             f"Campaign '{name_or_path}' not found under {self.base_dir}"
@@ -254,6 +438,10 @@ class StorageManager:
     def save_campaign(self, campaign: Campaign) -> None:
         campaign.modified_at = datetime.now(timezone.utc).isoformat()
         save_campaign_to_disk(campaign)
+        root = Path(campaign.path)
+        sig = self._meta_signature(root)
+        if sig is not None:
+            self._campaign_cache[root.resolve()] = (sig, _clone_campaign(campaign))
 
     def import_image(
         self,
@@ -265,6 +453,7 @@ class StorageManager:
         ocr_provider: Optional["OCRProvider"] = None,
         ocr_roi_spec: Optional[Any] = None,
         ocr_template_key: Optional[str] = None,
+        move_source: bool = False,
     ) -> Snapshot:
         return import_image_into_campaign(
             campaign=campaign,
@@ -275,21 +464,79 @@ class StorageManager:
             ocr_provider=ocr_provider,
             ocr_roi_spec=ocr_roi_spec,
             ocr_template_key=ocr_template_key,
+            move_source=move_source,
         )
 
+    def import_images(
+        self,
+        campaign: Campaign,
+        sources: Iterable[Tuple[Path, FilterType | str, Optional[str]]],
+        *,
+        ocr_provider: Optional["OCRProvider"] = None,
+        ocr_roi_spec: Optional[Any] = None,
+        ocr_template_key: Optional[str] = None,
+        move_source: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> List[Union[Snapshot, Exception]]:
+        """
+        Import many (src_path, filter_type, date_str) items in parallel.
+        OCR, copying and thumbnail decode/resize run on worker threads (Pillow
+        releases the GIL); the snapshots are then added in input order and
+        metadata.json is written once for the whole batch.
+        Returns one result per item, in input order: the imported Snapshot, or
+        the exception that item failed with. Failed items do not stop the
+        others from being imported and saved.
+        """
+        if not campaign.path:
+            raise ValueError("campaign.path must be set before importing images")
+
+        def _prepare_one(item) -> Snapshot:
+            src_path, filter_type, date_str = item
+            return _prepare_import(
+                campaign,
+                Path(src_path),
+                filter_type,
+                date_str,
+                create_dirs_if_missing=True,
+                ocr_provider=ocr_provider,
+                ocr_roi_spec=ocr_roi_spec,
+                ocr_template_key=ocr_template_key,
+                move_source=move_source,
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            futures = [pool.submit(_prepare_one, item) for item in sources]
+        results: List[Union[Snapshot, Exception]] = []
+        for fut in futures:
+            try:
+                results.append(fut.result())
+            except Exception as exc:
+                results.append(exc)
+        snaps = [r for r in results if isinstance(r, Snapshot)]
+        for snap in snaps:
+            campaign.add_snapshot(snap)
+        if snaps:
+            save_campaign_to_disk(campaign)
+        return results
+
     def list_campaigns(self) -> Iterable[str]:
         """List campaign directories under base_dir."""
-        for p in sorted(self.base_dir.iterdir()):
-            if p.is_dir():
-                yield p.name
+        # scandir reports the entry type from readdir, so no stat per entry
+        with os.scandir(self.base_dir) as it:
+            names = [e.name for e in it if e.is_dir()]
+        yield from sorted(names)
 
     def find_snapshot_by_id(
         self, campaign: Campaign, snapshot_id: str
     ) -> Optional[Snapshot]:
-        for s in campaign.snapshots:
-            if s.id == snapshot_id:
-                return s
-        return None
+        return campaign.get_snapshot_by_id(snapshot_id)
+
+    def find_snapshots_batch(
+        self, campaign: Campaign, snapshot_ids: Iterable[str]
+    ) -> List[Optional[Snapshot]]:
+        """Look up many ids at once; missing ids map to None, order is kept."""
+        get = campaign.get_snapshot_by_id
+        return [get(x) for x in snapshot_ids]
 
     def delete_snapshots(
         self,
@@ -1,11 +1,24 @@
 # chroniclemap/temporal/engine.py
 from __future__ import annotations
 
-from dataclasses import dataclass
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Callable, Optional, Union
 
-from chroniclemap.core.models import Campaign, FilterType, GameDate, Snapshot
+from chroniclemap.core.models import (
+    Campaign,
+    FilterType,
+    GameDate,
+    Snapshot,
+    as_filter_type,
+    filter_key_of,
+)
+
+# tolerance so e.g. 0.1 * 10 lands on a whole day despite float error
+_FRAC_EPS = 1e-9
 
 
 @dataclass
@@ -17,6 +30,27 @@ class TemporalEngine:
     # new flag: if True, ignore real-world leap years and treat each year as 365 days
     ignore_leap_years: bool = True
 
+    # sorted snapshot index, rebuilt lazily whenever Campaign.snapshots_state() changes
+    _index_key: Optional[tuple] = field(default=None, init=False, repr=False)
+    _sorted_ords: array = field(
+        default_factory=lambda: array("q"), init=False, repr=False
+    )
+    _sorted_snaps: list = field(default_factory=list, init=False, repr=False)
+    _by_filter: dict = field(default_factory=dict, init=False, repr=False)
+    # exact-date buckets keyed by order_key, in the same order as _sorted_snaps
+    _snaps_by_date: dict = field(default_factory=dict, init=False, repr=False)
+    # last index returned per filter, so monotonic playback skips the bisect
+    _last_index: dict = field(default_factory=dict, init=False, repr=False)
+    # playback rate in days/sec, memoized on (units, value, ignore_leap_years)
+    _rate_key: Optional[tuple] = field(default=None, init=False, repr=False)
+    _cached_value_per_second: float = field(default=0.0, init=False, repr=False)
+    # sub-day remainder carried between ticks
+    _frac_days: float = field(default=0.0, init=False, repr=False)
+    # order_key last passed to on_time_update, so unchanged ticks stay silent
+    _last_emitted_ord: Optional[int] = field(default=None, init=False, repr=False)
+    # (input, parsed) of the last non-GameDate seek target
+    _last_seek: Optional[tuple] = field(default=None, init=False, repr=False)
+
     def __post_init__(self):
         if self.current_date is None:
             if self.campaign.snapshots:
@@ -40,8 +74,21 @@ class TemporalEngine:
         self.playing = False
 
     def seek(self, to_date: Union[str, GameDate]):
-        self.current_date = GameDate.fromiso(to_date)
+        if not isinstance(to_date, GameDate):
+            # remember the last parsed string so repeated seeks skip fromiso
+            last = self._last_seek
+            if last is not None and last[0] == to_date:
+                to_date = last[1]
+            else:
+                parsed = GameDate.fromiso(to_date)
+                self._last_seek = (to_date, parsed)
+                to_date = parsed
+        # keep the existing object when the date is unchanged
+        if to_date != self.current_date:
+            self.current_date = to_date
+        self._frac_days = 0.0
         if self.on_time_update:
+            self._last_emitted_ord = self.current_date.order_key()
             self.on_time_update(self.current_date)
 
     def get_current_date(self) -> GameDate:
@@ -51,10 +98,56 @@ class TemporalEngine:
         """
         Advance internal clock by dt_seconds * playback_rate (days/sec).
         If ignore_leap_years is True, use no-leap ordinal arithmetic.
+        Sub-day remainders are carried over to the next tick (reset on seek);
+        on_time_update only fires when the date actually changes.
+        """
+        ignore_leap = self.ignore_leap_years
+        on_time_update = self.on_time_update
+        current_date = self.current_date
+
+        # accumulate fractional days so short ticks eventually add up
+        total = self._frac_days + self._rate() * float(dt_seconds)
+        whole = math.floor(total + _FRAC_EPS)
+        self._frac_days = total - whole
+
+        if whole:
+            # convert current date to ordinal (0-based); precomputed on GameDate
+            cur_ord = current_date.to_ordinal(ignore_leap=ignore_leap)
+            current_date = GameDate.from_ordinal(
+                cur_ord + whole, ignore_leap=ignore_leap
+            )
+            self.current_date = current_date
+
+        if on_time_update:
+            o = current_date.order_key()
+            if o != self._last_emitted_ord:
+                self._last_emitted_ord = o
+                on_time_update(current_date)
+
+    def seconds_until_next_day(self) -> Optional[float]:
         """
+        Playback seconds until tick() next changes the date, or None if the
+        playback rate is not positive. Lets callers sleep instead of polling.
+        """
+        rate = self._rate()
+        if rate <= 0:
+            return None
+        return max(0.0, (1.0 - _FRAC_EPS - self._frac_days) / rate)
+
+    def _rate(self) -> float:
         ps = self.get_playback_speed()
-        units = ps.get("units", "days/sec")
-        value = float(ps.get("value", 1.0))
+        key = (
+            ps.get("units", "days/sec"),
+            ps.get("value", 1.0),
+            self.ignore_leap_years,
+        )
+        if key != self._rate_key:
+            self._cached_value_per_second = self._days_per_second(key[0], key[1])
+            self._rate_key = key
+        return self._cached_value_per_second
+
+    def _days_per_second(self, units: str, value) -> float:
+        value = float(value)
 
         if units == "years/sec":
             value *= 365 if self.ignore_leap_years else 365.2425
@@ -64,51 +157,107 @@ class TemporalEngine:
             pass
         else:
             raise ValueError(f"Invalid playback unit: {units}")
+        return value
 
-        days_advance = value * float(dt_seconds)
+    # snapshot selection helpers
+    def _ensure_index(self) -> None:
+        key = self.campaign.snapshots_state()
+        if key == self._index_key:
+            return
+        snaps = self.campaign.snapshots
+        ordered = sorted(snaps, key=lambda s: s.date.order_key())
+        # date order keys as a packed int64 column next to the object list
+        self._sorted_ords = array("q", [s.date.order_key() for s in ordered])
+        self._sorted_snaps = ordered
+        by_date: dict = {}
+        for s in ordered:
+            by_date.setdefault(s.date.order_key(), []).append(s)
+        self._snaps_by_date = by_date
+        self._by_filter = {}
+        self._last_index = {}
+        self._index_key = key
 
-        # convert current date to ordinal (0-based)
-        cur_ord = self.current_date.to_ordinal(ignore_leap=self.ignore_leap_years)
-        new_ord = int(round(cur_ord + days_advance))
-        self.current_date = GameDate.from_ordinal(
-            new_ord, ignore_leap=self.ignore_leap_years
-        )
+    def _index_for(self, filter_type: Optional[FilterType]) -> tuple[array, list]:
+        self._ensure_index()
+        if filter_type is None:
+            return self._sorted_ords, self._sorted_snaps
+        key = filter_key_of(filter_type)
+        sub = self._by_filter.get(key)
+        if sub is None:
+            ft = as_filter_type(filter_type)
+            if isinstance(ft, FilterType):
+                snaps = [s for s in self._sorted_snaps if s.filter_type is ft]
+            else:
+                snaps = [s for s in self._sorted_snaps if s.filter_key == key]
+            sub = (array("q", [s.date.order_key() for s in snaps]), snaps)
+            self._by_filter[key] = sub
+        return sub
 
-        if self.on_time_update:
-            self.on_time_update(self.current_date)
+    def _latest_index(
+        self, ords: array, o: int, filter_type: Optional[FilterType]
+    ) -> int:
+        """Index of the last key <= o (or -1), reusing the previous hit if valid."""
+        key = None if filter_type is None else filter_key_of(filter_type)
+        i = self._last_index.get(key)
+        if (
+            i is not None
+            and 0 <= i < len(ords)
+            and ords[i] <= o
+            and (i + 1 == len(ords) or ords[i + 1] > o)
+        ):
+            return i
+        i = bisect_right(ords, o) - 1
+        self._last_index[key] = i
+        return i
 
-    # snapshot selection helpers (unchanged)
     def get_snapshot_for(
         self,
         d: GameDate,
         filter_type: Optional[FilterType] = None,
         prefer_latest_before: bool = True,
     ) -> Optional[Snapshot]:
-        for s in self.campaign.snapshots:
-            if s.date == d and (filter_type is None or s.filter_type == filter_type):
-                return s
-        if not prefer_latest_before:
+        self._ensure_index()
+        o = d.order_key()
+        bucket = self._snaps_by_date.get(o)
+        if bucket is not None:
+            if filter_type is None:
+                return bucket[0]
+            ft = as_filter_type(filter_type)
+            if isinstance(ft, FilterType):
+                for s in bucket:
+                    if s.filter_type is ft:
+                        return s
+            else:
+                key = filter_key_of(ft)
+                for s in bucket:
+                    if s.filter_key == key:
+                        return s
+        ords, snaps = self._index_for(filter_type)
+        idx = self._latest_index(ords, o, filter_type)
+        if idx < 0:
             return None
-        candidates = [
-            s
-            for s in self.campaign.snapshots
-            if s.date <= d and (filter_type is None or s.filter_type == filter_type)
-        ]
-        if not candidates:
+        found = ords[idx]
+        if found != o and not prefer_latest_before:
             return None
-        return max(candidates, key=lambda s: s.date)
+        # several snapshots may share a date: return the first one
+        return snaps[bisect_left(ords, found, 0, idx)]
 
     def next_snapshot_after(
         self, d: GameDate, filter_type: Optional[FilterType] = None
     ) -> Optional[Snapshot]:
-        candidates = [
-            s
-            for s in self.campaign.snapshots
-            if s.date > d and (filter_type is None or s.filter_type == filter_type)
-        ]
-        if not candidates:
+        ords, snaps = self._index_for(filter_type)
+        idx = bisect_right(ords, d.order_key())
+        if idx >= len(snaps):
             return None
-        return min(candidates, key=lambda s: s.date)
+        return snaps[idx]
+
+    def peek_next_snapshots(
+        self, filter_type: Optional[FilterType] = None, k: int = 2
+    ) -> list[Snapshot]:
+        """Return up to k snapshots after the current date, in playback order."""
+        ords, snaps = self._index_for(filter_type)
+        idx = bisect_right(ords, self.current_date.order_key())
+        return snaps[idx : idx + k]
 
     def step_to_next_snapshot(
         self, filter_type: Optional[FilterType] = None
@@ -1,24 +1,85 @@
 # chroniclemap/vision/ocr.py
 from __future__ import annotations
 
+import hashlib
+import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 try:
-    from PIL import Image, ImageFilter, ImageOps, UnidentifiedImageError
+    from PIL import Image, ImageOps, UnidentifiedImageError
 except Exception:
     Image = None
 
+# hot-path Pillow callables bound once (pytesseract stays a module attribute
+# so its command and functions can still be swapped at runtime)
+_open_image = Image.open if Image else None
+_grayscale = ImageOps.grayscale if Image else None
+_from_array = Image.fromarray if Image else None
+
 try:
     import pytesseract  # type: ignore
 except Exception:
     pytesseract = None
 
+try:
+    # optional: in-process libtesseract binding, no subprocess per call
+    import tesserocr  # type: ignore
+except Exception:
+    tesserocr = None
+
+try:
+    # optional: SIMD grayscale decode / resize / threshold for the ROI
+    import cv2  # type: ignore
+except Exception:
+    cv2 = None
+
 # regex to find date-like patterns in OCR output
 DATE_REGEX = re.compile(
     r"(?P<y>\d{3,4})[.\-/年](?P<m>\d{1,2})[.\-/月](?P<d>\d{1,2})"
 )  # FIXME: support more date formats, and BCE
+# same pattern with positional groups, matched line by line in the OCR hot path
+DATE_LINE_RE = re.compile(r"(\d{3,4})[.\-/年](\d{1,2})[.\-/月](\d{1,2})")
+# cheap prefilter: text without any digit cannot hold a date
+_HAS_DIGIT = re.compile(r"\d")
+
+
+def _match_date(text: str) -> Optional[str]:
+    """Return the first date in text as 'YYYY-MM-DD', scanning one line at a time."""
+    if _HAS_DIGIT.search(text) is None:
+        return None
+    search = DATE_LINE_RE.search
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        m = search(line)
+        if m:
+            y, mo, d = m.groups()
+            # month/day are 1-2 digit runs, so padding needs no int()
+            return f"{y}-{mo.zfill(2)}-{d.zfill(2)}"
+    return None
+
+
+# the date ROI holds one line of digits and separators: single-line page
+# segmentation skips layout analysis, and the whitelist plus disabled word
+# dictionaries keep the recognizer from searching the full lexicon
+TESSERACT_DATE_CONFIG = (
+    "--psm 7 -c tessedit_char_whitelist=0123456789-./年月"
+    " -c load_system_dawg=0 -c load_freq_dawg=0"
+)
+
+# the same settings for tesserocr, applied when its API is initialized
+TESSEROCR_DATE_VARIABLES = {
+    "tessedit_char_whitelist": "0123456789-./年月",
+    "load_system_dawg": "0",
+    "load_freq_dawg": "0",
+}
 
 # default ROI templates keyed by game id; values map "WIDTHxHEIGHT" -> (left, top, right, bottom)
 # and may also include a 'relative' fallback (fractions)
@@ -31,6 +92,41 @@ DEFAULT_ROI_TEMPLATES: Dict[str, Dict[str, Any]] = {
     # more games can be added here
 }
 
+# normalize once: absolute ROIs to int tuples, the relative fallback to floats
+for _tpl in DEFAULT_ROI_TEMPLATES.values():
+    for _k, _v in list(_tpl.items()):
+        _cast = float if _k == "relative" else int
+        _tpl[_k] = tuple(_cast(x) for x in _v)
+del _tpl, _k, _v, _cast
+
+
+def otsu_threshold(histogram: List[int]) -> int:
+    """
+    Otsu's threshold for a 256-bin grayscale histogram (as returned by
+    PIL's Image.histogram() for mode "L"). Pixels > threshold are foreground.
+    """
+    total = sum(histogram)
+    if not total:
+        return 127
+    sum_all = sum(i * c for i, c in enumerate(histogram))
+    sum_bg = 0
+    weight_bg = 0
+    best_t, best_var = 0, -1.0
+    for t, count in enumerate(histogram):
+        weight_bg += count
+        if not weight_bg:
+            continue
+        weight_fg = total - weight_bg
+        if not weight_fg:
+            break
+        sum_bg += t * count
+        mean_bg = sum_bg / weight_bg
+        mean_fg = (sum_all - sum_bg) / weight_fg
+        var = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+        if var > best_var:
+            best_t, best_var = t, var
+    return best_t
+
 
 def _is_relative_roi(roi: Tuple[float, float, float, float]) -> bool:
     return all(0.0 <= v <= 1.0 for v in roi)
@@ -49,9 +145,56 @@ def compute_roi(
       - tuple of floats (relative fractions): treated as fractions of width/height
       - dict template (like DEFAULT_ROI_TEMPLATES[game])
     If template_key provided, try to lookup in DEFAULT_ROI_TEMPLATES.
+    Results are memoized per (size, roi_spec, template_key).
     """
     w, h = image_size
+    # fast paths for the common explicit 4-tuple specs; nothing worth caching
+    if type(roi_spec) is tuple and len(roi_spec) == 4:
+        if type(roi_spec[0]) is int:
+            return roi_spec
+        if type(roi_spec[0]) is float:
+            return (
+                int(roi_spec[0] * w),
+                int(roi_spec[1] * h),
+                int(roi_spec[2] * w),
+                int(roi_spec[3] * h),
+            )
+    try:
+        key = _freeze_roi_spec(roi_spec)
+        hash(key)
+    except TypeError:
+        return _compute_roi(w, h, roi_spec, template_key)
+    return _compute_roi_cached(w, h, key, template_key)
+
+
+def _freeze_roi_spec(roi_spec: Optional[Any]) -> Any:
+    # hashable stand-in for roi_spec; lists become tuples
+    if roi_spec is None:
+        return None
+    if isinstance(roi_spec, dict):
+        items = (
+            (k, tuple(v) if isinstance(v, list) else v) for k, v in roi_spec.items()
+        )
+        return ("dict", tuple(sorted(items)))
+    if isinstance(roi_spec, (tuple, list)):
+        return ("seq", tuple(roi_spec))
+    return ("raw", roi_spec)
+
 
+@lru_cache(maxsize=64)
+def _compute_roi_cached(
+    w: int, h: int, key: Any, template_key: Optional[str]
+) -> Tuple[int, int, int, int]:
+    roi_spec = None
+    if key is not None:
+        kind, payload = key
+        roi_spec = dict(payload) if kind == "dict" else payload
+    return _compute_roi(w, h, roi_spec, template_key)
+
+
+def _compute_roi(
+    w: int, h: int, roi_spec: Optional[Any], template_key: Optional[str]
+) -> Tuple[int, int, int, int]:
     # 1) explicit roi_spec
     if roi_spec:
         # if dict with keys 'abs'/'rel' or exact mapping
@@ -60,10 +203,11 @@ def compute_roi(
             key = f"{w}x{h}"
             if key in roi_spec:
                 spec = roi_spec[key]
-                if isinstance(spec, (tuple, list)):
-                    if all(isinstance(x, int) for x in spec):
+                # ROI tuples are homogeneous, so the first element decides
+                if isinstance(spec, (tuple, list)) and spec:
+                    if type(spec[0]) is int:
                         return tuple(int(x) for x in spec)
-                    if all(isinstance(x, float) for x in spec):
+                    if type(spec[0]) is float:
                         left = int(spec[0] * w)
                         top = int(spec[1] * h)
                         right = int(spec[2] * w)
@@ -79,9 +223,9 @@ def compute_roi(
                 return (left, top, right, bottom)
         # tuple/list
         if isinstance(roi_spec, (tuple, list)) and len(roi_spec) == 4:
-            if all(isinstance(x, int) for x in roi_spec):
+            if type(roi_spec[0]) is int:
                 return tuple(int(x) for x in roi_spec)
-            if all(isinstance(x, float) for x in roi_spec):
+            if type(roi_spec[0]) is float:
                 left = int(roi_spec[0] * w)
                 top = int(roi_spec[1] * h)
                 right = int(roi_spec[2] * w)
@@ -93,8 +237,7 @@ def compute_roi(
         tpl = DEFAULT_ROI_TEMPLATES[template_key]
         key = f"{w}x{h}"
         if key in tpl:
-            spec = tpl[key]
-            return tuple(int(x) for x in spec)
+            return tpl[key]
         # try relative
         if "relative" in tpl:
             rel = tpl["relative"]
@@ -112,7 +255,36 @@ def compute_roi(
     return (left, top, right, bottom)
 
 
+# screenshots at least this tall are decoded at half scale when the format allows
+DRAFT_MIN_HEIGHT = 2160
+
+
+def _draft_gray(img, roi: Tuple[int, int, int, int]) -> Tuple[int, int, int, int]:
+    """
+    Ask the decoder (JPEG only, via PIL's draft) for grayscale output, at half
+    scale for 4K-class images, before any pixels are decoded. Returns roi
+    mapped onto the possibly reduced image.
+    """
+    w, h = img.size
+    target = (w // 2, h // 2) if h >= DRAFT_MIN_HEIGHT else (w, h)
+    try:
+        img.draft("L", target)
+    except Exception:
+        return roi
+    nw, nh = img.size
+    if (nw, nh) == (w, h):
+        return roi
+    left, top, right, bottom = roi
+    return (left * nw // w, top * nh // h, right * nw // w, bottom * nh // h)
+
+
 class OCRProvider:
+    # extract_dates worker pool, created on first use and released by close();
+    # once closed, extract_dates runs inline instead of starting a new pool
+    _pool: Optional[ThreadPoolExecutor] = None
+    _pool_lock = threading.Lock()
+    _closed = False
+
     def extract_date(
         self,
         image_path: Path,
@@ -127,6 +299,62 @@ class OCRProvider:
         """
         raise NotImplementedError
 
+    def extract_dates(
+        self,
+        image_paths: Iterable[Path],
+        roi_spec: Optional[Any] = None,
+        template_key: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[Optional[str]]:
+        """
+        Run extract_date over several images concurrently, in input order.
+        Tesseract releases the GIL (subprocess or tesserocr), so threads scale
+        with cores. A failing image yields None instead of aborting the batch.
+        The worker threads persist across calls until close(), so per-thread
+        state such as tesserocr APIs is built once; max_workers only sizes the
+        pool when it is first created. After close() images are OCR'd inline.
+        """
+        paths = list(image_paths)
+        if not paths:
+            return []
+
+        def one(p: Path) -> Optional[str]:
+            try:
+                return self.extract_date(
+                    p, roi_spec=roi_spec, template_key=template_key
+                )
+            except Exception:
+                return None
+
+        pool = self._worker_pool(max_workers)
+        if pool is None or len(paths) == 1:
+            return [one(p) for p in paths]
+        return list(pool.map(one, paths))
+
+    def _worker_pool(self, max_workers: Optional[int]) -> Optional[ThreadPoolExecutor]:
+        with self._pool_lock:
+            if self._closed:
+                return None
+            if self._pool is None:
+                workers = max_workers or os.cpu_count() or 1
+                if workers <= 1:
+                    return None
+                self._pool = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="ocr"
+                )
+            return self._pool
+
+    def close(self) -> None:
+        """
+        Shut down the extract_dates worker threads. Later extract_dates calls
+        still work, but run on the calling thread.
+        """
+        with self._pool_lock:
+            self._closed = True
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
 
 class MockOCRProvider(OCRProvider):
     """
@@ -141,30 +369,26 @@ class MockOCRProvider(OCRProvider):
         template_key: Optional[str] = None,
     ) -> Optional[str]:
         # filename pattern
-        m = DATE_REGEX.search(image_path.name)
-        if m:
-            return f"{m.group('y')}-{int(m.group('m')):02d}-{int(m.group('d')):02d}"
+        found = _match_date(image_path.name)
+        if found:
+            return found
 
         # fallback: if pytesseract available, attempt to run on ROI (useful for integration tests)
         if pytesseract and Image:
             try:
-                img = Image.open(image_path)
+                img = _open_image(image_path)
             except UnidentifiedImageError:
                 return None
             except Exception:
                 return None
             try:
-                from PIL import ImageOps
-
-                roi = compute_roi(
-                    img.size, roi_spec=roi_spec, template_key=template_key
-                )
+                size = img.size  # header only, nothing decoded yet
+                roi = compute_roi(size, roi_spec=roi_spec, template_key=template_key)
+                roi = _draft_gray(img, roi)
                 cropped = img.crop(roi)
-                gray = ImageOps.grayscale(cropped)
-                txt = pytesseract.image_to_string(gray)
-                m2 = DATE_REGEX.search(txt)
-                if m2:
-                    return f"{m2.group('y')}-{int(m2.group('m')):02d}-{int(m2.group('d')):02d}"
+                gray = _grayscale(cropped)
+                txt = pytesseract.image_to_string(gray, config=TESSERACT_DATE_CONFIG)
+                return _match_date(txt)
             except Exception:
                 return None
         return None
@@ -173,6 +397,12 @@ class MockOCRProvider(OCRProvider):
 class TesseractOCRProvider(OCRProvider):
     """
     Uses pytesseract. Requires pytesseract and system tesseract binary.
+    Detected dates are remembered per file content (SHA-1), ROI and template,
+    so re-importing the same screenshot skips Tesseract; cache_size=0 disables.
+    With prefer_filename (default) a date in the file name wins and no OCR runs.
+    When tesserocr is installed (and no tesseract_cmd is forced) recognition
+    runs in-process through a long-lived API per thread instead of spawning
+    the tesseract binary for every image.
     """
 
     def __init__(
@@ -180,13 +410,24 @@ class TesseractOCRProvider(OCRProvider):
         lang: str = "chi_sim+eng",
         tesseract_cmd: Optional[str] = None,
         preprocess_threshold: bool = True,
+        cache_size: int = 256,
+        prefer_filename: bool = True,
     ):
-        if pytesseract is None:
+        if pytesseract is None and tesserocr is None:
             raise RuntimeError("pytesseract not installed")
-        if tesseract_cmd:
+        if tesseract_cmd and pytesseract is not None:
             pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+        self.use_tesserocr = tesserocr is not None and not (
+            tesseract_cmd and pytesseract is not None
+        )
+        # tesserocr APIs are not thread-safe; extract_dates gets one per worker
+        self._apis = threading.local()
         self.lang = lang
         self.preprocess_threshold = preprocess_threshold
+        self.prefer_filename = prefer_filename
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple, str] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def extract_date(
         self,
@@ -194,24 +435,112 @@ class TesseractOCRProvider(OCRProvider):
         roi_spec: Optional[Any] = None,
         template_key: Optional[str] = None,
     ) -> Optional[str]:
+        if self.prefer_filename:
+            found = _match_date(Path(image_path).name)
+            if found:
+                return found
         if Image is None:
             raise RuntimeError("Pillow not installed")
-        img = Image.open(image_path)
+        key = self._cache_key(image_path, roi_spec, template_key)
+        if key is not None:
+            with self._cache_lock:
+                hit = self._cache.get(key)
+                if hit is not None:
+                    self._cache.move_to_end(key)
+                    return hit
+        gray = self._preprocess_cv2(image_path, roi_spec, template_key)
+        if gray is None:
+            gray = self._preprocess_pil(image_path, roi_spec, template_key)
+        # OCR
+        found = _match_date(self._ocr_text(gray))
+        if found and key is not None:
+            with self._cache_lock:
+                self._cache[key] = found
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return found
+
+    def _ocr_text(self, gray) -> str:
+        if self.use_tesserocr:
+            api = getattr(self._apis, "api", None)
+            if api is None:
+                api = tesserocr.PyTessBaseAPI(
+                    lang=self.lang,
+                    psm=tesserocr.PSM.SINGLE_LINE,
+                    variables=TESSEROCR_DATE_VARIABLES,
+                )
+                self._apis.api = api
+            api.SetImage(gray)
+            return api.GetUTF8Text()
+        return pytesseract.image_to_string(
+            gray, lang=self.lang, config=TESSERACT_DATE_CONFIG
+        )
+
+    def _cache_key(
+        self,
+        image_path: Path,
+        roi_spec: Optional[Any],
+        template_key: Optional[str],
+    ) -> Optional[tuple]:
+        if self.cache_size <= 0:
+            return None
+        try:
+            roi_key = _freeze_roi_spec(roi_spec)
+            hash(roi_key)
+            digest = hashlib.sha1(Path(image_path).read_bytes()).hexdigest()
+        except (TypeError, OSError):
+            return None
+        return (digest, roi_key, template_key, self.lang, self.preprocess_threshold)
+
+    def _preprocess_pil(
+        self,
+        image_path: Path,
+        roi_spec: Optional[Any],
+        template_key: Optional[str],
+    ):
+        img = _open_image(image_path)
+        # JPEGs decode straight to one luma channel (no RGB buffer); other
+        # formats ignore the draft and are converted after cropping
+        img.draft("L", img.size)
         roi = compute_roi(img.size, roi_spec=roi_spec, template_key=template_key)
         cropped = img.crop(roi)
         # preprocess
-        gray = ImageOps.grayscale(cropped)
+        gray = cropped if cropped.mode == "L" else _grayscale(cropped)
         w, h = gray.size
-        # enlarge small crops for better OCR
+        # enlarge small crops for better OCR; Lanczos keeps glyph edges clean
         scale = 1
         if max(w, h) < 800:
             scale = 2
-            gray = gray.resize((int(w * scale), int(h * scale)))
+            gray = gray.resize((int(w * scale), int(h * scale)), Image.LANCZOS)
         if self.preprocess_threshold:
-            gray = gray.filter(ImageFilter.MedianFilter())
-        # OCR
-        txt = pytesseract.image_to_string(gray, lang=self.lang)
-        m = DATE_REGEX.search(txt)
-        if m:
-            return f"{m.group('y')}-{int(m.group('m')):02d}-{int(m.group('d')):02d}"
-        return None
+            # hand Tesseract a 1-bit image so it skips its own Otsu pass
+            t = otsu_threshold(gray.histogram())
+            return gray.point(lambda v: 255 if v > t else 0, mode="1")
+        return gray
+
+    def _preprocess_cv2(
+        self,
+        image_path: Path,
+        roi_spec: Optional[Any],
+        template_key: Optional[str],
+    ):
+        """Same steps as _preprocess_pil with OpenCV; None if it cannot be used."""
+        if cv2 is None:
+            return None
+        # decode straight to grayscale, skipping the RGB decode
+        arr = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
+        if arr is None:
+            return None
+        h, w = arr.shape[:2]
+        left, top, right, bottom = compute_roi(
+            (w, h), roi_spec=roi_spec, template_key=template_key
+        )
+        crop = arr[top:bottom, left:right]
+        if crop.size == 0:
+            return None
+        if max(crop.shape) < 800:
+            crop = cv2.resize(crop, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
+        if self.preprocess_threshold:
+            _, crop = cv2.threshold(crop, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+            return _from_array(crop).convert("1")
+        return _from_array(crop)
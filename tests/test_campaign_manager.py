@@ -70,6 +70,29 @@ def test_delete_campaign_via_gui(
     assert not (tmp_data_dir / "Campaigns" / "ToDelete").exists()
 
 
+def test_campaign_list_updates_incrementally(monkeypatch, qtbot, manager_widget, store):
+    store.create_campaign("Alpha")
+    store.create_campaign("Gamma")
+    manager_widget.refresh_list()
+
+    monkeypatch.setattr(QInputDialog, "getText", lambda *a, **k: ("Beta", True))
+    qtbot.mouseClick(manager_widget.new_btn, Qt.LeftButton)
+
+    def names():
+        lw = manager_widget.list_widget
+        return [lw.item(i).data(Qt.UserRole) for i in range(lw.count())]
+
+    assert names() == ["Alpha", "Beta", "Gamma"]
+
+    manager_widget.list_widget.setCurrentRow(0)
+    monkeypatch.setattr(QMessageBox, "question", lambda *a, **k: QMessageBox.Yes)
+    qtbot.mouseClick(manager_widget.delete_btn, Qt.LeftButton)
+    assert names() == ["Beta", "Gamma"]
+
+    manager_widget.refresh_list()
+    assert names() == ["Beta", "Gamma"]
+
+
 def test_edit_note_saves_metadata(
     monkeypatch, qtbot, manager_widget, store, tmp_data_dir
 ):
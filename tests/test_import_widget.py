@@ -1,14 +1,18 @@
+import os
 import shutil
+import threading
 from pathlib import Path
 
 import pytest
-from PySide6.QtWidgets import QDialog
+from PIL import Image
+from PySide6.QtCore import QThreadPool
+from PySide6.QtWidgets import QDialog, QFileDialog
 
-from chroniclemap.core.models import FilterType, GameDate
+from chroniclemap.core.models import FilterType, GameDate, new_snapshot
 from chroniclemap.gui.campaign_store import CampaignStore
 from chroniclemap.gui.import_widget import ImportWidget
 from chroniclemap.storage.manager import StorageManager
-from chroniclemap.vision.ocr import TesseractOCRProvider
+from chroniclemap.vision.ocr import MockOCRProvider, TesseractOCRProvider
 
 # ---- skip if tesseract unavailable ----
 try:
@@ -81,3 +85,139 @@ def test_import_widget_with_real_tesseract_ocr(qtbot, tmp_path, monkeypatch):
     gd = GameDate.fromiso(date_iso)
 
     assert gd.to_iso() == "1066-09-15"
+
+
+def test_import_widget_last_snapshot_date_per_filter(qtbot, tmp_path):
+    data_root = tmp_path / "data"
+    store = CampaignStore(data_root)
+    store.create_campaign("dates")
+    storage = StorageManager(data_root)
+    camp = storage.load_campaign("dates")
+    for iso, flt in [
+        ("-0100-01-01", FilterType.REALMS),
+        ("-0050-06-01", FilterType.REALMS),
+        ("0010-01-01", FilterType.FAITH),
+    ]:
+        camp.add_snapshot(new_snapshot(date_str=iso, filter_type=flt, path="x.png"))
+    storage.save_campaign(camp)
+
+    w = ImportWidget(
+        campaign_name="dates",
+        campaign_store=store,
+        storage_manager=storage,
+        ocr_provider=None,
+    )
+    qtbot.addWidget(w)
+
+    # BCE dates compare by value, not as strings
+    assert w._get_last_snapshot_date("realms") == "-0050-06-01"
+    assert w._get_last_snapshot_date("faith") == "0010-01-01"
+    assert w._get_last_snapshot_date("culture") is None
+
+    w._note_snapshot_date(
+        new_snapshot(date_str="0020-01-01", filter_type=FilterType.FAITH, path="y.png")
+    )
+    assert w._get_last_snapshot_date("faith") == "0020-01-01"
+
+    w.invalidate_snapshot_dates()
+    assert w._get_last_snapshot_date("faith") == "0010-01-01"
+
+    # selection and interval are mirrored from widget signals
+    assert w.current_filter() == "realms"
+    w.filter_buttons[1].setChecked(True)
+    assert w.current_filter() == w.filter_buttons[1].text()
+    w.interval_unit.setCurrentIndex(w.interval_unit.findData("months"))
+    w.interval_spin.setValue(3)
+    assert w._get_interval_setting() == (3, "months")
+
+
+def test_import_widget_batch_import_uses_batch_ocr(qtbot, tmp_path, monkeypatch):
+    data_root = tmp_path / "data"
+    store = CampaignStore(data_root)
+    store.create_campaign("batch")
+    storage = StorageManager(data_root)
+
+    srcs = []
+    for name in ["shot_1444-11-11.png", "shot_1445-02-03.png"]:
+        p = tmp_path / name
+        Image.new("RGB", (32, 32), "white").save(p)
+        srcs.append(str(p))
+
+    calls = []
+
+    class CountingOCR(MockOCRProvider):
+        def extract_dates(self, image_paths, **kwargs):
+            calls.append(list(image_paths))
+            return super().extract_dates(calls[-1], **kwargs)
+
+        def extract_date(self, image_path, roi_spec=None, template_key=None):
+            calls.append(image_path)
+            return super().extract_date(image_path, roi_spec, template_key)
+
+    w = ImportWidget(
+        campaign_name="batch",
+        campaign_store=store,
+        storage_manager=storage,
+        ocr_provider=CountingOCR(),
+    )
+    qtbot.addWidget(w)
+    monkeypatch.setattr(QFileDialog, "getOpenFileNames", lambda *a, **k: (srcs, ""))
+    with qtbot.waitSignal(w.batch_imported, timeout=5000) as blocker:
+        w.on_batch_import()
+    assert blocker.args == [2]
+
+    camp = storage.load_campaign("batch")
+    assert sorted(s.date.to_iso() for s in camp.snapshots) == [
+        "1444-11-11",
+        "1445-02-03",
+    ]
+    # every file is OCR'd once, through the batch entry point
+    batches = [c for c in calls if isinstance(c, list)]
+    singles = [c for c in calls if not isinstance(c, list)]
+    assert [p for b in batches for p in b] == [Path(p) for p in srcs]
+    assert sorted(singles) == sorted(Path(p) for p in srcs)
+
+
+def test_import_widget_cancel_batch_stops_ocr_job(qtbot, tmp_path, monkeypatch):
+    data_root = tmp_path / "data"
+    store = CampaignStore(data_root)
+    store.create_campaign("cancel")
+    storage = StorageManager(data_root)
+
+    srcs = []
+    for i in range(4):
+        p = tmp_path / f"shot_1444-01-0{i + 1}.png"
+        Image.new("RGB", (16, 16), "white").save(p)
+        srcs.append(str(p))
+
+    started = threading.Event()
+    release = threading.Event()
+
+    class BlockingOCR(MockOCRProvider):
+        def extract_dates(self, image_paths, **kwargs):
+            started.set()
+            release.wait(5)
+            return super().extract_dates(image_paths, **kwargs)
+
+    w = ImportWidget(
+        campaign_name="cancel",
+        campaign_store=store,
+        storage_manager=storage,
+        ocr_provider=BlockingOCR(),
+    )
+    qtbot.addWidget(w)
+    monkeypatch.setattr(QFileDialog, "getOpenFileNames", lambda *a, **k: (srcs, ""))
+    monkeypatch.setattr(os, "cpu_count", lambda: 1)
+    w.on_batch_import()
+    job = w._batch_job
+    assert started.wait(5)
+
+    with qtbot.waitSignal(w.batch_imported, timeout=1000) as blocker:
+        w.cancel_batch()
+    assert blocker.args == [0] and w._batch_job is None
+    release.set()
+    assert QThreadPool.globalInstance().waitForDone(5000)
+    qtbot.wait(20)
+    # the job stopped after the chunk in flight, and its result was dropped
+    assert job._cancelled
+    assert storage.load_campaign("cancel").snapshots == []
@@ -1,10 +1,15 @@
 # tests/test_models.py
+import pytest
+
 from chroniclemap.core.models import (
     Campaign,
     FilterType,
     GameDate,
     Rank,
     RankPeriod,
+    civil_from_days_no_leap,
+    days_from_civil_no_leap,
+    days_in_month,
     new_campaign,
     new_ruler,
     new_snapshot,
@@ -151,3 +156,81 @@ def test_date_arithmetic_bce_and_wide_range():
     assert plus_5.year == 1
     assert plus_5.month == 1
     assert plus_5.day == 4
+
+
+def test_no_leap_ordinal_helpers_roundtrip():
+    assert days_from_civil_no_leap(1, 1, 1) == 0
+    assert days_from_civil_no_leap(-1, 12, 31) == -1
+    assert civil_from_days_no_leap(-365) == (-1, 1, 1)
+    for z in range(-800, 800, 7):
+        y, m, d = civil_from_days_no_leap(z)
+        assert y != 0
+        assert days_from_civil_no_leap(y, m, d) == z
+        assert GameDate(y, m, d).to_ordinal(ignore_leap=True) == z
+
+
+def test_days_in_month_handles_leap_and_bce_years():
+    assert days_in_month(2001, 2) == 28
+    assert days_in_month(2000, 2) == 29
+    assert days_in_month(1900, 2) == 28
+    assert days_in_month(-1, 2) == 29  # 1 BCE is astronomical year 0
+    assert days_in_month(-1, 4) == 30
+
+
+def test_campaign_get_latest_before():
+    camp = new_campaign("latest", path=None)
+    for iso, flt, path in [
+        ("-0050-01-01", FilterType.REALMS, "a.png"),
+        ("0100-01-01", FilterType.FAITH, "b.png"),
+        ("0100-01-01", FilterType.REALMS, "c.png"),
+        ("0200-01-01", FilterType.REALMS, "d.png"),
+    ]:
+        camp.add_snapshot(new_snapshot(date_str=iso, filter_type=flt, path=path))
+
+    assert camp.get_latest_before("-0100-01-01") is None
+    assert camp.get_latest_before("0150-01-01").path == "b.png"
+    assert camp.get_latest_before("0150-01-01", FilterType.REALMS).path == "c.png"
+    assert camp.get_latest_before(GameDate(50, 1, 1), "realms").path == "a.png"
+    assert camp.get_latest_before("0150-01-01", FilterType.CULTURE) is None
+
+
+def test_gamedate_compares_and_hashes_by_ordinal():
+    a = GameDate(-100, 3, 15)
+    b = GameDate(1066, 9, 15)
+    assert a < b <= GameDate(1066, 9, 15) and b > a >= GameDate(-100, 3, 15)
+    assert len({b, GameDate.fromiso("1066-09-15")}) == 1
+    assert sorted([b, a]) == [a, b]
+    assert b.to_ordinal() == b - GameDate(1970, 1, 1)
+    assert not hasattr(b, "__dict__")
+
+
+def test_snapshot_filter_type_normalized_to_enum():
+    snap = new_snapshot(date_str="1066-09-15", filter_type="faith", path="x.png")
+    assert snap.filter_type is FilterType.FAITH
+    snap.filter_type = "realms"
+    assert snap.filter_type is FilterType.REALMS and snap.filter_key == "realms"
+    snap.filter_type = "my-overlay"
+    assert snap.filter_type == "my-overlay" and snap.filter_key == "my-overlay"
+
+
+def test_fromiso_shares_parsed_instances():
+    a = GameDate.fromiso("1066-09-15")
+    assert GameDate.fromiso("1066-09-15") is a
+    assert GameDate.fromiso(" 1066.9.15 ") == a
+    with pytest.raises(ValueError):
+        GameDate.fromiso("not a date")
+
+
+def test_gamedate_year_zero_distinct_from_year_minus_one():
+    zero, minus_one = GameDate(0, 3, 15), GameDate(-1, 3, 15)
+    # both are astronomical year 0, so they share the real-calendar ordinal
+    assert zero.to_ordinal() == minus_one.to_ordinal()
+    assert zero != minus_one and len({zero, minus_one}) == 2
+    assert minus_one < zero < GameDate(1, 3, 15)
+    keys = [
+        GameDate(y, m, d).order_key()
+        for y in range(-3, 4)
+        for m in range(1, 13)
+        for d in range(1, days_in_month(y, m) + 1)
+    ]
+    assert len(set(keys)) == len(keys)
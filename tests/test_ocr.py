@@ -1,6 +1,7 @@
 # tests/test_ocr.py
+import threading
 
-from chroniclemap.vision.ocr import MockOCRProvider
+from chroniclemap.vision.ocr import MockOCRProvider, otsu_threshold
 
 
 def test_mock_ocr_from_filename(tmp_path):
@@ -17,3 +18,60 @@ def test_mock_ocr_no_date(tmp_path):
     prov = MockOCRProvider()
     out = prov.extract_date(p)
     assert out is None
+
+
+def test_otsu_threshold_splits_bimodal_histogram():
+    hist = [0] * 256
+    hist[30] = 500
+    hist[220] = 100
+    t = otsu_threshold(hist)
+    assert 30 <= t < 220
+    assert otsu_threshold([0] * 256) == 127
+
+
+def test_extract_dates_keeps_order_and_maps_failures(tmp_path):
+    names = ["a_1444-11-11.png", "b_nodate.png", "c_1066-10-14.png"]
+    paths = []
+    for name in names:
+        p = tmp_path / name
+        p.write_text("x")
+        paths.append(p)
+
+    class Flaky(MockOCRProvider):
+        def extract_date(self, image_path, roi_spec=None, template_key=None):
+            if "nodate" in image_path.name:
+                raise RuntimeError("tesseract failed")
+            return super().extract_date(image_path, roi_spec, template_key)
+
+    out = Flaky().extract_dates(paths, max_workers=3)
+    assert out == ["1444-11-11", None, "1066-10-14"]
+    assert MockOCRProvider().extract_dates([]) == []
+
+
+def test_extract_dates_reuses_worker_threads_until_close(tmp_path):
+    paths = []
+    for i in range(6):
+        p = tmp_path / f"shot_{1400 + i}-01-01.png"
+        p.write_text("x")
+        paths.append(p)
+
+    threads = set()
+
+    class Recording(MockOCRProvider):
+        def extract_date(self, image_path, roi_spec=None, template_key=None):
+            threads.add(threading.get_ident())
+            return super().extract_date(image_path, roi_spec, template_key)
+
+    ocr = Recording()
+    assert ocr.extract_dates(paths, max_workers=2)[0] == "1400-01-01"
+    ocr.extract_dates(paths, max_workers=2)
+    # both batches ran on the same two pool threads
+    assert len(threads) <= 2 and threading.get_ident() not in threads
+    pool = ocr._pool
+    ocr.close()
+    assert ocr._pool is None and pool._shutdown
+
+    # a batch started after close runs inline rather than re-creating a pool
+    threads.clear()
+    assert ocr.extract_dates(paths, max_workers=2)[-1] == "1405-01-01"
+    assert threads == {threading.get_ident()} and ocr._pool is None
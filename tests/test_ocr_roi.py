@@ -1,6 +1,8 @@
 # tests/test_ocr_roi.py
 
-from chroniclemap.vision.ocr import DEFAULT_ROI_TEMPLATES, compute_roi
+from PIL import Image
+
+from chroniclemap.vision.ocr import DEFAULT_ROI_TEMPLATES, _draft_gray, compute_roi
 
 
 def test_compute_roi_absolute():
@@ -22,3 +24,23 @@ def test_template_match_and_fallback():
     out = compute_roi((w, h), roi_spec=None, template_key="ck3")
     # should match the template provided earlier
     assert out == DEFAULT_ROI_TEMPLATES["ck3"]["1920x1080"]
+
+
+def test_compute_roi_dict_spec_and_repeat_calls():
+    spec = {"1280x720": [10, 20, 30, 40], "relative": (0.5, 0.5, 1.0, 1.0)}
+    assert compute_roi((1280, 720), roi_spec=spec) == (10, 20, 30, 40)
+    # same spec again (served from the memo) and a size that uses 'relative'
+    assert compute_roi((1280, 720), roi_spec=spec) == (10, 20, 30, 40)
+    assert compute_roi((800, 600), roi_spec=spec) == (400, 300, 800, 600)
+    # no spec and no template: bottom-right quarter
+    assert compute_roi((100, 100)) == (75, 75, 100, 100)
+
+
+def test_draft_gray_maps_roi_onto_reduced_jpeg(tmp_path):
+    p = tmp_path / "shot.jpg"
+    Image.new("RGB", (3840, 2160), "red").save(p)
+    with Image.open(p) as img:
+        roi = _draft_gray(img, (2920, 2072, 3840, 2160))
+        assert img.mode == "L"
+        assert img.size == (1920, 1080)
+        assert roi == (1460, 1036, 1920, 1080)
@@ -10,6 +10,7 @@ try:
 except Exception:
     pytesseract = None
 
+from chroniclemap.vision import ocr as ocr_mod
 from chroniclemap.vision.ocr import TesseractOCRProvider, compute_roi
 
 skip_condition = (pytesseract is None) or (shutil.which("tesseract") is None)
@@ -37,3 +38,44 @@ def test_tesseract_extracts_date_from_synthetic(tmp_path):
     out = prov.extract_date(p, roi_spec=None, template_key="ck3")
     assert out is not None
     assert out.startswith("1066")
+
+
+@pytest.mark.skipif(pytesseract is None, reason="pytesseract not available")
+def test_tesseract_results_cached_by_content(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_image_to_string(img, **kwargs):
+        calls.append(img.size)
+        return "1066-9-15\n"
+
+    monkeypatch.setattr(ocr_mod.pytesseract, "image_to_string", fake_image_to_string)
+    monkeypatch.setattr(ocr_mod, "tesserocr", None)
+    a = tmp_path / "a.png"
+    Image.new("RGB", (320, 200), color=(30, 30, 30)).save(a)
+    b = tmp_path / "copy.png"
+    b.write_bytes(a.read_bytes())
+
+    prov = TesseractOCRProvider()
+    assert prov.extract_date(a) == "1066-09-15"
+    # same bytes under another name: served from the cache
+    assert prov.extract_date(b) == "1066-09-15"
+    assert len(calls) == 1
+    # a different ROI is a different question
+    assert prov.extract_date(a, roi_spec=(0, 0, 100, 100)) == "1066-09-15"
+    assert len(calls) == 2
+
+    uncached = TesseractOCRProvider(cache_size=0)
+    uncached.extract_date(a)
+    uncached.extract_date(a)
+    assert len(calls) == 4
+
+
+@pytest.mark.skipif(pytesseract is None, reason="pytesseract not available")
+def test_tesseract_prefers_date_in_filename(tmp_path, monkeypatch):
+    def fail(*a, **k):
+        raise AssertionError("tesseract should not run")
+
+    monkeypatch.setattr(ocr_mod.pytesseract, "image_to_string", fail)
+    p = tmp_path / "map_1066-9-15_realms.png"
+    Image.new("RGB", (64, 64)).save(p)
+    assert TesseractOCRProvider().extract_date(p) == "1066-09-15"
@@ -0,0 +1,247 @@
+# tests/test_player_window.py
+import os
+import time
+
+import pytest
+from PIL import Image
+from PySide6.QtCore import QThreadPool
+from PySide6.QtGui import QPixmapCache
+
+from chroniclemap.core.models import FilterType, GameDate
+from chroniclemap.gui import player_window, workers
+from chroniclemap.gui.campaign_store import CampaignStore
+from chroniclemap.gui.player_window import PlayerWindow
+from chroniclemap.gui.texts import tr
+from chroniclemap.storage.manager import StorageManager
+
+
+@pytest.fixture
+def data_root(tmp_path):
+    return tmp_path / "data"
+
+
+class FakeClock:
+    """Stands in for the player's QElapsedTimer: every tick lasts step_ms."""
+
+    def __init__(self, step_ms=1000):
+        self.step_ms = step_ms
+
+    def start(self):
+        pass
+
+    def restart(self):
+        return self.step_ms
+
+
+def make_campaign(tmp_path, data_root, entries, name="camp", size=(64, 32)):
+    """Create a campaign holding one imported image per (date, filter) entry."""
+    CampaignStore(data_root).create_campaign(name)
+    storage = StorageManager(data_root)
+    camp = storage.load_campaign(name)
+    for i, (date_str, filt) in enumerate(entries):
+        src = tmp_path / f"src_{i}.png"
+        Image.new("RGB", size, (40 * i % 256, 80, 120)).save(src)
+        storage.import_image(camp, src, filt, date_str=date_str)
+    return storage.load_campaign(name)
+
+
+def make_player(qtbot, data_root, name="camp"):
+    w = PlayerWindow(name, storage_base_dir=data_root)
+    qtbot.addWidget(w)
+    return w
+
+
+def wait_painted(qtbot, w):
+    qtbot.waitUntil(
+        lambda: not w._frame_pending
+        and not w._canvas_dirty
+        and not w._paint_timer.isActive()
+    )
+
+
+def shown_name(w):
+    return w.current_snapshot_label.text()
+
+
+def test_player_shows_placeholder_for_empty_campaign(qtbot, data_root):
+    CampaignStore(data_root).create_campaign("empty")
+    w = make_player(qtbot, data_root, "empty")
+
+    qtbot.waitUntil(lambda: w.image_label.text() == tr("player.no_snapshot_date"))
+    assert w.current_snapshot_label.text() == tr("player.snapshot_na")
+
+
+def test_player_close_with_decodes_in_flight(qtbot, tmp_path, data_root, monkeypatch):
+    make_campaign(
+        tmp_path,
+        data_root,
+        [
+            ("1444-01-01", FilterType.REALMS),
+            ("1444-02-01", FilterType.REALMS),
+            ("1444-03-01", FilterType.REALMS),
+        ],
+    )
+    run = workers.PixmapLoadRunnable.run
+
+    def slow_run(job):
+        time.sleep(0.2)
+        run(job)
+
+    monkeypatch.setattr(workers.PixmapLoadRunnable, "run", slow_run)
+    w = PlayerWindow("camp", storage_base_dir=data_root)
+    # before the first snapshot, so the upcoming ones are read ahead
+    w.engine.seek(GameDate(1443, 1, 1))
+    w._request_frame()
+    qtbot.waitUntil(lambda: bool(w._prefetching))
+    w.close()
+    w.deleteLater()
+    # let the deferred delete run while the decodes are still sleeping
+    qtbot.wait(20)
+
+    QThreadPool.globalInstance().waitForDone(5000)
+    qtbot.wait(50)
+
+
+def test_player_tick_delay_is_clamped(qtbot, tmp_path, data_root):
+    make_campaign(tmp_path, data_root, [("1444-01-01", FilterType.REALMS)])
+    w = make_player(qtbot, data_root)
+
+    w.engine.set_playback_speed("days/sec", 10000)
+    w._on_play()
+    assert w._timer.interval() == player_window.FRAME_INTERVAL_MS
+    w.engine.set_playback_speed("days/sec", 0.01)
+    w._schedule_tick()
+    assert w._timer.interval() == player_window.IDLE_TICK_MS
+    w.engine.set_playback_speed("days/sec", 0)
+    w._schedule_tick()
+    assert w._timer.interval() == player_window.IDLE_TICK_MS
+    w._on_pause()
+    assert not w._timer.isActive()
+
+
+def test_player_playback_across_ticks_and_filters(qtbot, tmp_path, data_root):
+    make_campaign(
+        tmp_path,
+        data_root,
+        [
+            ("1444-01-01", FilterType.REALMS),
+            ("1444-01-02", FilterType.FAITH),
+            ("1444-01-03", FilterType.REALMS),
+        ],
+    )
+    w = make_player(qtbot, data_root)
+    w.filter_combo.setCurrentText(FilterType.REALMS.value)
+    w.engine.set_playback_speed("days/sec", 1)
+    w.engine.seek(GameDate(1444, 1, 1))
+    w._clock = FakeClock(1000)
+    w._on_play()
+    w._timer.stop()  # the test drives the ticks itself
+
+    expected = ["1444-01-01.png", "1444-01-03.png", "1444-01-03.png"]
+    seen = []
+    for _ in expected:
+        w._on_tick()
+        wait_painted(qtbot, w)
+        seen.append(shown_name(w))
+        assert w._painted_path == w._lookup_snap.path
+        assert not w.image_label.pixmap().isNull()
+    assert seen == expected
+    assert w.engine.get_current_date() == GameDate(1444, 1, 4)
+    assert w.current_date_edit.text() == "1444-01-04"
+
+    w.filter_combo.setCurrentText(FilterType.FAITH.value)
+    wait_painted(qtbot, w)
+    assert shown_name(w) == "1444-01-02.png"
+
+    # a filter without snapshots keeps ticking on the placeholder
+    w.filter_combo.setCurrentText(FilterType.CULTURE.value)
+    for _ in range(3):
+        w._on_tick()
+        wait_painted(qtbot, w)
+        assert shown_name(w) == tr("player.snapshot_na")
+        assert w._painted_path is None
+        assert w.image_label.text() == tr("player.no_snapshot_date")
+
+    w.filter_combo.setCurrentText(FilterType.REALMS.value)
+    wait_painted(qtbot, w)
+    assert shown_name(w) == "1444-01-03.png"
+    assert not w.image_label.pixmap().isNull()
+
+
+def test_player_playback_on_empty_campaign(qtbot, data_root):
+    CampaignStore(data_root).create_campaign("empty")
+    w = make_player(qtbot, data_root, "empty")
+    w._clock = FakeClock(1000)
+    w._on_play()
+    w._timer.stop()
+
+    start = w.engine.get_current_date()
+    for filt in [FilterType.REALMS, FilterType.CULTURE]:
+        w.filter_combo.setCurrentText(filt.value)
+        for _ in range(2):
+            w._on_tick()
+            wait_painted(qtbot, w)
+            assert shown_name(w) == tr("player.snapshot_na")
+            assert w.image_label.text() == tr("player.no_snapshot_date")
+    assert w.engine.get_current_date() > start
+
+
+def test_player_coalesces_frame_and_fit_requests(qtbot, tmp_path, data_root):
+    make_campaign(tmp_path, data_root, [("1444-01-01", FilterType.REALMS)])
+    w = make_player(qtbot, data_root)
+    wait_painted(qtbot, w)
+
+    frames = []
+    update_frame = w._update_frame
+    w._update_frame = lambda: (frames.append(1), update_frame())
+    fits = []
+    do_fit = w._do_fit
+    w._do_fit = lambda: (fits.append(1), do_fit())
+
+    for _ in range(3):
+        w._request_frame()
+        w._request_fit()
+    qtbot.wait(20)
+    assert frames == [1]
+    assert fits == [1]
+
+
+def test_player_shows_thumbnail_before_full_decode(qtbot, tmp_path, data_root):
+    make_campaign(
+        tmp_path,
+        data_root,
+        [("1444-01-01", FilterType.REALMS), ("1444-06-01", FilterType.REALMS)],
+        size=(1600, 800),
+    )
+    w = make_player(qtbot, data_root)
+    w.filter_combo.setCurrentText(FilterType.REALMS.value)
+    w.engine.seek(GameDate(1444, 1, 1))
+    w._request_frame()
+    wait_painted(qtbot, w)
+    snap = w._lookup_snap
+    assert w._painted_path == snap.path
+
+    # the import thumbnail goes up first, the sharper decode replaces it
+    thumb = w._thumb_pixmap(snap.thumbnail)
+    assert thumb is not None and thumb.width() == 400
+    qtbot.waitUntil(lambda: w._shown_pix is not None and w._shown_pix.width() > 400)
+    assert QPixmapCache.find(w._cache_key(snap.path)) is not None
+
+    # the snapshot after the playhead was decoded ahead of time
+    nxt = w.engine.peek_next_snapshots(FilterType.REALMS, k=1)[0]
+    qtbot.waitUntil(lambda: QPixmapCache.find(w._cache_key(nxt.path)) is not None)
+    assert not w._prefetching
+
+
+def test_player_cache_key_tracks_file_changes(qtbot, tmp_path, data_root):
+    camp = make_campaign(tmp_path, data_root, [("1444-01-01", FilterType.REALMS)])
+    w = make_player(qtbot, data_root)
+    path = camp.snapshots[0].path
+
+    key = w._cache_key(path)
+    assert key == w._cache_key(path)
+    Image.new("RGB", (128, 64), "red").save(path)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert w._cache_key(path) != key
+    assert w._cache_key(str(tmp_path / "missing.png")).endswith("#-")
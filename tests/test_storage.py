@@ -1,4 +1,5 @@
 # tests/test_storage.py
+import errno
 from pathlib import Path
 
 import pytest
@@ -6,7 +7,8 @@ from PIL import Image
 
 from chroniclemap.core.models import FilterType
 from chroniclemap.core.models import GameDate as date
-from chroniclemap.core.models import new_campaign
+from chroniclemap.core.models import Snapshot, new_campaign
+from chroniclemap.storage import manager as manager_mod
 from chroniclemap.storage.manager import (
     StorageManager,
     create_campaign_on_disk,
@@ -150,6 +152,26 @@ def test_storage_manager_load_nonexistent_campaign(tmp_path):
         manager.load_campaign(tmp_path / "nonexistent" / "path")
 
 
+def test_storage_manager_load_campaign_cached_copies(tmp_path):
+    manager = StorageManager(tmp_path)
+    manager.create_campaign("cached")
+    first = manager.load_campaign("cached")
+    first.notes = "not saved"
+    second = manager.load_campaign("cached")
+    assert second is not first
+    assert second.notes is None
+
+    # writes that bypass the manager are picked up through the file stat
+    second.notes = "external"
+    save_campaign_to_disk(second)
+    assert manager.load_campaign("cached").notes == "external"
+
+    second.notes = "saved"
+    manager.save_campaign(second)
+    second.notes = "changed after save"
+    assert manager.load_campaign("cached").notes == "saved"
+
+
 def test_storage_manager_save_campaign_updates_metadata(tmp_path):
     """测试通过 StorageManager 保存活动元数据"""
     manager = StorageManager(tmp_path)
@@ -196,6 +218,106 @@ def test_storage_manager_import_image(tmp_path):
     assert "realms" in snap.path.lower()
 
 
+def test_storage_manager_import_image_move_source(tmp_path):
+    """测试 move_source=True 时源文件被移动而不是复制"""
+    manager = StorageManager(tmp_path)
+    camp = manager.create_campaign("move-campaign")
+
+    src = tmp_path / "clip.png"
+    Image.new("RGB", (64, 48), color=(0, 0, 255)).save(src)
+
+    snap = manager.import_image(
+        camp, src, FilterType.REALMS, "1066-10-14", move_source=True
+    )
+
+    assert not src.exists()
+    assert Path(snap.path).exists()
+    assert Path(snap.thumbnail).exists()
+
+
+def test_safe_copy_move_falls_back_across_devices(tmp_path, monkeypatch):
+    src = tmp_path / "clip.png"
+    Image.new("RGB", (64, 48), color=(0, 255, 0)).save(src)
+    data = src.read_bytes()
+
+    def cross_device(a, b):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(manager_mod.os, "replace", cross_device)
+    dest = manager_mod._safe_copy_image_to_target(
+        src, tmp_path / "maps", "1066-10-14", move=True
+    )
+    assert not src.exists()
+    assert dest.name == "1066-10-14.png" and dest.read_bytes() == data
+
+
+def test_storage_manager_import_images_parallel(tmp_path):
+    manager = StorageManager(tmp_path)
+    camp = manager.create_campaign("bulk")
+    sources = []
+    for i, day in enumerate(["1066-09-15", "1066-09-15", "1100-01-01", "1200-06-30"]):
+        src = tmp_path / f"bulk{i}.png"
+        Image.new("RGB", (120, 80), color=(i * 40, 0, 0)).save(src)
+        sources.append((src, FilterType.REALMS, day))
+
+    snaps = manager.import_images(camp, sources, max_workers=4)
+
+    assert [s.date.to_iso() for s in snaps] == [d for _, _, d in sources]
+    # same-date imports get distinct files
+    assert len({s.path for s in snaps}) == 4
+    assert all(Path(s.path).exists() and Path(s.thumbnail).exists() for s in snaps)
+    reloaded = manager.load_campaign("bulk")
+    assert {s.id for s in reloaded.snapshots} == {s.id for s in snaps}
+
+
+def test_storage_manager_import_images_saves_once(tmp_path, monkeypatch):
+    manager = StorageManager(tmp_path)
+    camp = manager.create_campaign("bulk-once")
+    sources = []
+    for i in range(3):
+        src = tmp_path / f"once{i}.png"
+        Image.new("RGB", (60, 40)).save(src)
+        sources.append((src, "realms", f"110{i}-01-01"))
+    sources.append((tmp_path / "missing.png", "realms", "1200-01-01"))
+
+    saves = []
+    real_save = manager_mod.save_campaign_to_disk
+    monkeypatch.setattr(
+        manager_mod,
+        "save_campaign_to_disk",
+        lambda c: (saves.append(len(c.snapshots)), real_save(c)),
+    )
+    results = manager.import_images(camp, sources)
+    assert isinstance(results[-1], FileNotFoundError)
+    # the good items are still recorded, in a single metadata write
+    assert saves == [3]
+    assert len(manager.load_campaign("bulk-once").snapshots) == 3
+    assert len(list((Path(camp.path) / "maps" / "realms").iterdir())) == 3
+
+
+def test_storage_manager_import_images_reports_every_item(tmp_path):
+    manager = StorageManager(tmp_path)
+    camp = manager.create_campaign("bulk-mixed")
+    sources = []
+    for i, name in enumerate(["ok0.png", "gone1.png", "ok2.png", "gone3.png"]):
+        src = tmp_path / name
+        if name.startswith("ok"):
+            Image.new("RGB", (60, 40)).save(src)
+        sources.append((src, "realms", f"110{i}-01-01"))
+
+    results = manager.import_images(camp, sources, max_workers=2)
+
+    assert [type(r) for r in results] == [
+        Snapshot,
+        FileNotFoundError,
+        Snapshot,
+        FileNotFoundError,
+    ]
+    assert "gone1.png" in str(results[1]) and "gone3.png" in str(results[3])
+    saved = manager.load_campaign("bulk-mixed").snapshots
+    assert sorted(s.id for s in saved) == sorted([results[0].id, results[2].id])
+
+
 def test_storage_manager_import_image_with_string_filter(tmp_path):
     """测试使用字符串类型的 filter_type 导入"""
     manager = StorageManager(tmp_path)
@@ -237,6 +359,9 @@ def test_storage_manager_find_snapshot_by_id(tmp_path):
     not_found = manager.find_snapshot_by_id(camp, "invalid-id-12345")
     assert not_found is None
 
+    batch = manager.find_snapshots_batch(camp, [snap2.id, "invalid-id-12345", snap1.id])
+    assert [s.id if s else None for s in batch] == [snap2.id, None, snap1.id]
+
 
 def test_storage_manager_find_snapshot_empty_campaign(tmp_path):
     """测试在空活动中查找快照"""
@@ -1,4 +1,6 @@
 # tests/test_temporal.py
+import pytest
+
 from chroniclemap.core.models import FilterType
 from chroniclemap.core.models import GameDate as date
 from chroniclemap.core.models import new_campaign, new_snapshot
@@ -139,6 +141,72 @@ def test_engine_tick_fractional_days():
     assert engine2.get_current_date() == date(2000, 1, 2)
 
 
+def test_engine_tick_accumulates_sub_day_steps():
+    camp = new_campaign("accum-test", path=None)
+    engine = TemporalEngine(campaign=camp, ignore_leap_years=True)
+    engine.set_playback_speed("days/sec", 1.0)
+    engine.seek(date(2000, 1, 1))
+
+    for _ in range(99):
+        engine.tick(0.01)
+    assert engine.get_current_date() == date(2000, 1, 1)
+    engine.tick(0.01)
+    assert engine.get_current_date() == date(2000, 1, 2)
+
+    # seek drops any pending remainder
+    engine.tick(0.5)
+    engine.seek(date(2000, 1, 1))
+    engine.tick(0.5)
+    assert engine.get_current_date() == date(2000, 1, 1)
+
+
+def test_engine_tick_only_notifies_on_date_change():
+    camp = new_campaign("notify-test", path=None)
+    seen = []
+    engine = TemporalEngine(campaign=camp, on_time_update=seen.append)
+    engine.set_playback_speed("days/sec", 1.0)
+    engine.seek(date(2000, 1, 1))
+    assert seen == [date(2000, 1, 1)]
+
+    for _ in range(10):
+        engine.tick(0.25)
+    assert seen == [date(2000, 1, 1), date(2000, 1, 2), date(2000, 1, 3)]
+
+
+def test_engine_seconds_until_next_day():
+    camp = new_campaign("wake-test", path=None)
+    engine = TemporalEngine(campaign=camp)
+    engine.set_playback_speed("days/sec", 2.0)
+    engine.seek(date(2000, 1, 1))
+    assert abs(engine.seconds_until_next_day() - 0.5) < 1e-6
+
+    engine.tick(0.2)
+    wait = engine.seconds_until_next_day()
+    assert abs(wait - 0.3) < 1e-6
+    engine.tick(wait)
+    assert engine.get_current_date() == date(2000, 1, 2)
+
+    engine.set_playback_speed("days/sec", 0.0)
+    assert engine.seconds_until_next_day() is None
+
+
+def test_engine_rate_follows_in_place_speed_edits():
+    camp = new_campaign("rate", path=None)
+    engine = TemporalEngine(campaign=camp, ignore_leap_years=True)
+    engine.set_playback_speed("days/sec", 1.0)
+    assert engine.seconds_until_next_day() == pytest.approx(1.0)
+
+    # the same dict edited in place
+    camp.config.playback_speed["value"] = 4.0
+    assert engine.seconds_until_next_day() == pytest.approx(0.25)
+
+    camp.config.playback_speed["units"] = "years/sec"
+    camp.config.playback_speed["value"] = 1.0
+    assert engine.seconds_until_next_day() == pytest.approx(1 / 365)
+    engine.ignore_leap_years = False
+    assert engine.seconds_until_next_day() == pytest.approx(1 / 365.2425)
+
+
 def test_engine_playback_speed_variations():
     """
     Test that different playback speeds correctly affect time advancement.
@@ -187,3 +255,146 @@ def test_engine_playback_speed_variations():
     assert engine_std.get_current_date() == date(
         2000, 2, 29
     ), "Standard mode with speed 1.0 should respect leap days"
+
+
+def test_engine_snapshot_index_tracks_campaign_changes():
+    camp = new_campaign("index-test", path=None)
+    camp.add_snapshot(
+        new_snapshot(date_str="1444-01-01", filter_type=FilterType.REALMS, path="a.png")
+    )
+    camp.add_snapshot(
+        new_snapshot(date_str="1450-01-01", filter_type=FilterType.FAITH, path="b.png")
+    )
+    engine = TemporalEngine(campaign=camp)
+
+    assert engine.get_snapshot_for(date(1443, 1, 1)) is None
+    assert engine.get_snapshot_for(date(1460, 1, 1)).path == "b.png"
+    assert (
+        engine.get_snapshot_for(date(1460, 1, 1), filter_type=FilterType.REALMS).path
+        == "a.png"
+    )
+    assert (
+        engine.get_snapshot_for(
+            date(1445, 1, 1), FilterType.REALMS, prefer_latest_before=False
+        )
+        is None
+    )
+    assert engine.next_snapshot_after(date(1444, 1, 1)).path == "b.png"
+    assert engine.next_snapshot_after(date(1450, 1, 1)) is None
+    engine.seek(date(1440, 1, 1))
+    assert [s.path for s in engine.peek_next_snapshots()] == ["a.png", "b.png"]
+    assert [s.path for s in engine.peek_next_snapshots(FilterType.FAITH, k=5)] == [
+        "b.png"
+    ]
+    engine.seek(date(1444, 1, 1))
+
+    # snapshots added after the first lookup must be visible
+    camp.add_snapshot(
+        new_snapshot(date_str="1455-01-01", filter_type=FilterType.REALMS, path="c.png")
+    )
+    assert (
+        engine.get_snapshot_for(date(1460, 1, 1), filter_type=FilterType.REALMS).path
+        == "c.png"
+    )
+    assert engine.step_to_next_snapshot(filter_type=FilterType.REALMS) == date(
+        1455, 1, 1
+    )
+
+    # plain filter names resolve the same as the enum, and edits are tracked
+    assert engine.get_snapshot_for(date(1460, 1, 1), filter_type="realms").path == (
+        "c.png"
+    )
+    camp.snapshots[0].filter_type = FilterType.FAITH
+    assert camp.snapshots[0].filter_key == "faith"
+
+    # exact-date hits pick the snapshot matching the filter
+    camp.add_snapshot(
+        new_snapshot(
+            date_str="1455-01-01", filter_type=FilterType.CULTURE, path="d.png"
+        )
+    )
+    assert engine.get_snapshot_for(date(1455, 1, 1)).path == "c.png"
+    assert (
+        engine.get_snapshot_for(date(1455, 1, 1), filter_type=FilterType.CULTURE).path
+        == "d.png"
+    )
+
+
+def test_engine_keeps_year_zero_and_minus_one_apart():
+    camp = new_campaign("tmp", path=None)
+    for iso in ("-0001-03-15", "0000-03-15"):
+        camp.add_snapshot(
+            new_snapshot(date_str=iso, filter_type=FilterType.REALMS, path=iso)
+        )
+    engine = TemporalEngine(camp)
+    assert engine.get_snapshot_for(date(0, 3, 15)).path == "0000-03-15"
+    assert engine.get_snapshot_for(date(-1, 3, 15)).path == "-0001-03-15"
+
+
+def test_engine_index_sees_in_place_snapshot_edits():
+    camp = new_campaign("edits", path=None)
+    for iso, path in (("1444-01-01", "a.png"), ("1450-01-01", "b.png")):
+        camp.add_snapshot(
+            new_snapshot(date_str=iso, filter_type=FilterType.REALMS, path=path)
+        )
+    engine = TemporalEngine(campaign=camp)
+    assert engine.get_snapshot_for(date(1460, 1, 1)).path == "b.png"
+
+    # re-dating keeps the list length, but must still rebuild the index
+    camp.snapshots[1].date = date(1440, 1, 1)
+    camp.mark_snapshots_changed()
+    assert engine.get_snapshot_for(date(1445, 1, 1)).path == "a.png"
+
+    replacement = new_snapshot(
+        date_str="1470-01-01", filter_type=FilterType.REALMS, path="c.png"
+    )
+    camp.snapshots[0] = replacement
+    camp.mark_snapshots_changed()
+    assert engine.get_snapshot_for(date(1480, 1, 1)).path == "c.png"
+    assert camp.get_snapshot_by_id(replacement.id) is replacement
+
+    assert camp.remove_snapshot(replacement.id) is replacement
+    assert engine.get_snapshot_for(date(1480, 1, 1)).path == "b.png"
+
+
+def test_engine_index_ignores_edits_in_other_campaigns():
+    camps = []
+    for name in ("one", "two"):
+        camp = new_campaign(name, path=None)
+        camp.add_snapshot(
+            new_snapshot(
+                date_str="1444-01-01", filter_type=FilterType.REALMS, path=name
+            )
+        )
+        camps.append(camp)
+    engine = TemporalEngine(campaign=camps[0])
+    engine.get_snapshot_for(date(1445, 1, 1))
+    state = camps[0].snapshots_state()
+
+    camps[1].snapshots[0].date = date(1400, 1, 1)
+    camps[1].mark_snapshots_changed()
+    assert camps[0].snapshots_state() == state
+
+
+def test_engine_repeated_lookup_for_filter_without_snapshots():
+    camp = new_campaign("tmp", path=None)
+    camp.add_snapshot(
+        new_snapshot(
+            date_str="1444-01-01",
+            filter_type=FilterType.REALMS,
+            path="maps/realms/1444-01-01.png",
+        )
+    )
+    engine = TemporalEngine(campaign=camp)
+    d = date(1450, 1, 1)
+    for _ in range(2):
+        assert engine.get_snapshot_for(d, filter_type=FilterType.CULTURE) is None
+    assert engine.get_snapshot_for(d, filter_type=FilterType.REALMS) is not None
+
+
+def test_engine_repeated_lookup_on_empty_campaign():
+    engine = TemporalEngine(campaign=new_campaign("tmp", path=None))
+    d = date(1444, 1, 1)
+    for _ in range(2):
+        assert engine.get_snapshot_for(d) is None
+        assert engine.get_snapshot_for(d, filter_type=FilterType.REALMS) is None
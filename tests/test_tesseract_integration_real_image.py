@@ -30,7 +30,8 @@ def test_tesseract_extracts_date_from_real_image(tmp_path):
     assert img_path.exists(), f"Test image not found at {img_path}"
 
     # instantiate provider; ensure language includes english+chi_sim as needed
-    prov = TesseractOCRProvider(lang="chi_sim+eng")
+    # read the ROI, not the date in the file name
+    prov = TesseractOCRProvider(lang="chi_sim+eng", prefer_filename=False)
 
     # call extract_date: use template_key if your test image matches a template (e.g., "ck3")
     # If your image has different resolution / ROI, you can pass template_key=None or explicit roi_spec
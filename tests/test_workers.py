@@ -0,0 +1,62 @@
+from PySide6.QtCore import QSize, QThreadPool
+from PySide6.QtGui import QColor, QImage
+
+from chroniclemap.gui.workers import PixmapLoadRunnable, PixmapLoadSignals
+
+
+def test_pixmap_load_runnable_decodes_off_thread(qtbot, tmp_path):
+    path = tmp_path / "map.png"
+    img = QImage(64, 32, QImage.Format_RGB32)
+    img.fill(QColor("red"))
+    assert img.save(str(path))
+
+    job = PixmapLoadRunnable(str(path), epoch=7)
+    with qtbot.waitSignal(job.signals.result, timeout=5000) as blocker:
+        QThreadPool.globalInstance().start(job)
+    epoch, loaded_path, loaded = blocker.args
+    assert (epoch, loaded_path) == (7, str(path))
+    assert (loaded.width(), loaded.height()) == (64, 32)
+
+    missing = PixmapLoadRunnable(str(tmp_path / "missing.png"), epoch=8)
+    with qtbot.waitSignal(missing.signals.result, timeout=5000) as blocker:
+        QThreadPool.globalInstance().start(missing)
+    assert blocker.args[2].isNull()
+
+
+def test_pixmap_load_runnable_scales_down_to_max_size(qtbot, tmp_path):
+    path = tmp_path / "big.png"
+    img = QImage(800, 400, QImage.Format_RGB32)
+    img.fill(QColor("blue"))
+    assert img.save(str(path))
+
+    job = PixmapLoadRunnable(str(path), epoch=1, max_size=QSize(200, 200))
+    with qtbot.waitSignal(job.signals.result, timeout=5000) as blocker:
+        QThreadPool.globalInstance().start(job)
+    loaded = blocker.args[2]
+    assert (loaded.width(), loaded.height()) == (200, 100)
+
+    # never upscale images that already fit
+    job = PixmapLoadRunnable(str(path), epoch=2, max_size=QSize(1024, 1024))
+    with qtbot.waitSignal(job.signals.result, timeout=5000) as blocker:
+        QThreadPool.globalInstance().start(job)
+    assert blocker.args[2].width() == 800
+
+
+def test_pixmap_load_runnables_share_signals(qtbot, tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"map{i}.png"
+        img = QImage(8, 8, QImage.Format_RGB32)
+        img.fill(QColor("green"))
+        assert img.save(str(path))
+        paths.append(str(path))
+
+    signals = PixmapLoadSignals()
+    got = []
+    signals.result.connect(lambda epoch, path, _img: got.append((epoch, path)))
+    jobs = [PixmapLoadRunnable(p, i, signals=signals) for i, p in enumerate(paths)]
+    assert all(job.signals is signals for job in jobs)
+    for job in jobs:
+        QThreadPool.globalInstance().start(job)
+    qtbot.waitUntil(lambda: len(got) == 3, timeout=5000)
+    assert sorted(got) == list(enumerate(paths))